@@ -17,6 +17,8 @@ Scope & Responsibilities
 ------------------------------------------------------------------------------------
 - File existence and readability checks
 - File open validation with explicit encoding
+- Chunked (C engine) or multithreaded (pyarrow engine) reading with
+  incremental validation statistics
 - Schema validation against expected columns
 - Lightweight data sanity checks
 - Fail-fast behavior on validation errors
@@ -31,11 +33,22 @@ Design Notes
 ------------------------------------------------------------------------------------
 """
 
-from typing import List, Any
+from typing import List, Any, Dict, Tuple
 from pathlib import Path
 import logging
+import numpy as np
 import pandas as pd
 
+# Rows per read_csv chunk; validation statistics are accumulated per chunk
+EXTRACT_CHUNK_SIZE = 100_000
+
+# pyarrow (optional) parses CSV blocks on all cores; fall back to the C engine
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
 # ==================================================================================================
 # Extract Tasks
 # ==================================================================================================
@@ -69,7 +82,7 @@ def _validate_source_file_schema(
     """
     Validate DataFrame schema against expected columns.
 
-    :param data: Extracted DataFrame
+    :param data: Extracted DataFrame (or its header-only frame)
     :param expected_columns: Authoritative list of expected column names
     :param logger: Shared ETL logger instance
     :return: None
@@ -91,11 +104,98 @@ def _validate_source_file_schema(
         )
 
 
-def _perform_data_sanity_checks(data: pd.DataFrame, logger: logging.Logger) -> None:
+def _read_source_file(
+    path: Path,
+    expected_columns: List[str],
+    column_types_map: Dict[str, Any],
+    logger: logging.Logger
+) -> Tuple[pd.DataFrame, pd.Series, np.ndarray]:
+    """
+    Read source file in chunks, accumulating NULL counts and row hashes for
+    the sanity checks.
+
+    The header is read and validated first, so a file missing a typed column
+    fails the schema check rather than inside the typed read.
+
+    With pyarrow installed the file is parsed multithreaded as a single chunk;
+    otherwise the C engine streams it in EXTRACT_CHUNK_SIZE-row chunks.
+
+    Target dtypes are applied by the CSV parser itself: datetime columns are
+    passed via parse_dates, all other columns via dtype.
+
+    :param path: Path to source file
+    :param expected_columns: Authoritative list of expected column names
+    :param column_types_map: Mapping of column name to target dtype
+    :param logger: Shared ETL logger instance
+    :return: (data, per-column NULL counts, per-row hashes)
+    :raises: ValueError
+    """
+    header = pd.read_csv(path, nrows=0)
+    _validate_source_file_schema(header, expected_columns, logger)
+
+    logger.info("Reading source file with engine=%s: %s", CSV_ENGINE, path)
+
+    date_columns = [
+        col for col, dtype in column_types_map.items() if "datetime" in str(dtype)
+    ]
+    # Categoricals are built in the Clean phase once defaults are filled; per-chunk
+    # categories would not line up on concat, so parse them as plain strings
+    column_dtypes = {
+        col: "string" if str(dtype) == "category" else dtype
+        for col, dtype in column_types_map.items() if col not in date_columns
+    }
+    logger.info("Parsing with dtypes=%s, date columns=%s", column_dtypes, date_columns)
+
+    chunks = []
+    null_counts = None
+    row_hashes = []
+
+    if CSV_ENGINE == "pyarrow":
+        # The pyarrow engine does not support chunksize; it yields a single chunk
+        reader = [
+            pd.read_csv(
+                path,
+                dtype=column_dtypes,
+                parse_dates=date_columns,
+                engine="pyarrow"
+            )
+        ]
+    else:
+        reader = pd.read_csv(
+            path,
+            dtype=column_dtypes,
+            parse_dates=date_columns,
+            engine="c",
+            chunksize=EXTRACT_CHUNK_SIZE
+        )
+
+    for chunk in reader:
+        if not chunks:
+            null_counts = chunk.isna().sum()
+        else:
+            null_counts += chunk.isna().sum()
+
+        row_hashes.append(pd.util.hash_pandas_object(chunk, index=False).to_numpy())
+        chunks.append(chunk)
+
+    data = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+    logger.info("Read %d chunk(s) from source file", len(chunks))
+
+    return data, null_counts, np.concatenate(row_hashes)
+
+
+def _perform_data_sanity_checks(
+    data: pd.DataFrame,
+    null_counts: pd.Series,
+    row_hashes: np.ndarray,
+    logger: logging.Logger
+) -> None:
     """
     Perform basic data sanity checks.
 
     :param data: Extracted DataFrame
+    :param null_counts: Per-column NULL counts accumulated during read
+    :param row_hashes: Per-row hashes accumulated during read
     :param logger: Shared ETL logger instance
     :return: None
     :raises: ValueError
@@ -110,27 +210,29 @@ def _perform_data_sanity_checks(data: pd.DataFrame, logger: logging.Logger) -> N
 
     # Column-wise NULL percentage check
     NULL_THRESHOLD_PCT = 95.0
-    null_pct = data.isna().mean() * 100
-
-    for col, pct in null_pct.items():
-        if pct > NULL_THRESHOLD_PCT:
-            logger.error("NULL distribution:\n%s", null_pct)
-            raise ValueError(
-                f"Column '{col}' has {pct:.2f}% NULL values"
-            )
-
-    # Duplicate detection (no removal)
-    duplicates = data.duplicated(keep=False)
-    if duplicates.any():
-        dup_count = duplicates.sum()
-        sample_dups = data.loc[duplicates].head(5)
+    null_pct = (null_counts / row_count) * 100
 
-        logger.error("Duplicate rows detected: %d", dup_count)
+    violations = null_pct[null_pct > NULL_THRESHOLD_PCT]
+    if not violations.empty:
+        col, pct = next(iter(violations.items()))
+        logger.error("NULL distribution:\n%s", null_pct)
         raise ValueError(
-            "Duplicate rows found in source data.\n"
-            f"Sample:\n{sample_dups}"
+            f"Column '{col}' has {pct:.2f}% NULL values"
         )
 
+    # Duplicate detection (no removal); hash hits are confirmed on the frame
+    if np.unique(row_hashes).size != row_count:
+        duplicates = data.duplicated(keep="first")
+        if duplicates.any():
+            dup_count = int(duplicates.sum())
+            sample_dups = data.loc[duplicates].head(5)
+
+            logger.error("Duplicate rows detected: %d", dup_count)
+            raise ValueError(
+                "Duplicate rows found in source data.\n"
+                f"Sample:\n{sample_dups}"
+            )
+
 
 # ==================================================================================================
 # Execute Extract
@@ -140,6 +242,7 @@ def run_extract(
         source_name: str,
         file_path: Path,
         expected_columns: List[str],
+        column_types_map: Dict[str, Any],
         logger: logging.Logger
 ) -> pd.DataFrame:
     """
@@ -149,6 +252,7 @@ def run_extract(
     :param source_name: Source entity name (e.g., sales, customers)
     :param file_path: Path to source file
     :param expected_columns: Authoritative column list
+    :param column_types_map: Target data types applied while parsing
     :param logger: Shared ETL logger instance
     :return: Raw but validated DataFrame
     :raises: Exception
@@ -158,10 +262,10 @@ def run_extract(
 
         _validate_source_file_exists(file_path, logger)
 
-        data = pd.read_csv(file_path)
-
-        _validate_source_file_schema(data, expected_columns, logger)
-        _perform_data_sanity_checks(data, logger)
+        data, null_counts, row_hashes = _read_source_file(
+            file_path, expected_columns, column_types_map, logger
+        )
+        _perform_data_sanity_checks(data, null_counts, row_hashes, logger)
 
         logger.info("EXTRACT completed successfully for source=%s", source_name)
         return data
@@ -6,7 +6,8 @@ This module implements the **Load phase** for the Retail Sales ETL pipeline.
 
 It is responsible for:
 - Persisting modeled (T2) DataFrames into the warehouse database
-- Performing idempotent loads using DELETE + INSERT
+- Performing idempotent loads using DELETE + INSERT in a single transaction
+- Streaming rows into the target table chunk by chunk to bound memory
 - Validating post-load integrity using SQL-based checks
 - Logging all load activities and failures
 
@@ -31,12 +32,21 @@ Design Notes
 ------------------------------------------------------------------------------------
 """
 
-from typing import List
+from functools import lru_cache
+from typing import Any, Iterator, List, Tuple
 import sqlite3
 import logging
 
 import pandas as pd
 
+from utils.sqlite_limits import get_variable_limit
+
+# Default rows bound per INSERT statement (further capped by the parameter limit)
+LOAD_BATCH_SIZE = 1000
+
+# Built INSERT statements kept: a full and a partial chunk shape per table
+_STMT_CACHE_SIZE = 16
+
 
 # ==================================================================================================
 # Load Tasks
@@ -45,7 +55,8 @@ def _insert_data_in_db(
     data: pd.DataFrame,
     table_name: str,
     connection: sqlite3.Connection,
-    logger: logging.Logger
+    logger: logging.Logger,
+    batch_size: int = LOAD_BATCH_SIZE
 ) -> None:
     """
     Delete existing rows and bulk-insert DataFrame into a warehouse table.
@@ -54,6 +65,7 @@ def _insert_data_in_db(
     :param table_name: Target warehouse table
     :param connection: Active SQLite connection
     :param logger: Shared ETL logger
+    :param batch_size: Maximum rows per multi-row INSERT statement
     :return: None
     """
     try:
@@ -62,32 +74,41 @@ def _insert_data_in_db(
 
         connection.execute("BEGIN")
 
-        connection.execute(f"DELETE FROM {table_name}")
-        logger.info("Existing rows deleted from table=%s", table_name)
-
         if data.empty:
+            connection.execute(f"DELETE FROM {_quote_identifier(table_name)}")
             logger.info("No rows to insert for table=%s", table_name)
             connection.commit()
             return
 
         columns = list(data.columns)
-        column_list = ", ".join(columns)
-        placeholders = ", ".join(["?"] * len(columns))
+        column_list = ", ".join(_quote_identifier(col) for col in columns)
+        target_table = _quote_identifier(table_name)
 
-        insert_sql = f"""
-            INSERT INTO {table_name} ({column_list})
-            VALUES ({placeholders})
-        """
-        logger.info("Running insert sql query=%s", insert_sql)
-        data = _normalize_sqlite_types(data)
-        rows = [tuple(row) for row in data.itertuples(index=False, name=None)]
+        # DELETE and INSERT share one transaction; a failed insert rolls the
+        # delete back, so the target is never left partially loaded
+        connection.execute(f"DELETE FROM {target_table}")
+        logger.info("Existing rows deleted from table=%s", table_name)
 
-        connection.executemany(insert_sql, rows)
+        # Multi-row VALUES per statement, bounded by the SQLite parameter limit
+        max_rows = get_variable_limit(connection) // len(columns)
+        chunk_size = max(1, min(batch_size, max_rows))
+        logger.info(
+            "Running multi-row insert into table=%s | columns=%s | chunk_size=%d",
+            table_name,
+            column_list,
+            chunk_size
+        )
+
+        for row_count, params in _iter_insert_chunks(data, chunk_size):
+            insert_sql = _get_insert_statement(
+                target_table, column_list, len(columns), row_count
+            )
+            connection.execute(insert_sql, params)
 
         connection.commit()
         logger.info(
             "Successfully loaded %d rows into table=%s",
-            len(rows),
+            len(data),
             table_name
         )
 
@@ -105,7 +126,8 @@ def run_load(
     table_name: str,
     primary_key: List[str],
     connection: sqlite3.Connection,
-    logger: logging.Logger
+    logger: logging.Logger,
+    batch_size: int = LOAD_BATCH_SIZE
 ) -> None:
     """
     Execute the Load phase for a single warehouse table.
@@ -115,6 +137,7 @@ def run_load(
     :param primary_key: Primary key column(s) for integrity validation
     :param connection: Active SQLite connection
     :param logger: Shared ETL logger
+    :param batch_size: Maximum rows per multi-row INSERT statement
     :return: None
     """
     try:
@@ -122,7 +145,7 @@ def run_load(
 
         source_row_count = len(data)
 
-        _insert_data_in_db(data, table_name, connection, logger)
+        _insert_data_in_db(data, table_name, connection, logger, batch_size)
         _validate_data_integrity(
             table_name=table_name,
             primary_key=primary_key,
@@ -161,11 +184,35 @@ def _validate_data_integrity(
     logger.info("Validating post-load integrity for table=%s", table_name)
 
     # ------------------------------------------------------------------
-    # Row count validation
+    # Row count, NULL primary key and duplicate primary key counts are
+    # gathered in a single scan of the table
     # ------------------------------------------------------------------
-    cursor = connection.execute(f"SELECT COUNT(*) FROM {table_name}")
-    actual_row_count = cursor.fetchone()[0]
+    target_table = _quote_identifier(table_name)
+    quoted_pk = [_quote_identifier(pk) for pk in primary_key]
+    null_pk_condition = " OR ".join([f"{pk} IS NULL" for pk in quoted_pk])
+
+    # Composite keys are compared column by column; a concatenated key would
+    # collide, e.g. ('a|b', 'c') and ('a', 'b|c')
+    if len(quoted_pk) == 1:
+        distinct_pk_expression = f"COUNT(DISTINCT {quoted_pk[0]})"
+    else:
+        distinct_pk_expression = (
+            f"(SELECT COUNT(*) FROM (SELECT DISTINCT {', '.join(quoted_pk)} FROM {target_table}))"
+        )
+
+    integrity_query = f"""
+        SELECT
+            COUNT(*),
+            COALESCE(SUM(CASE WHEN {null_pk_condition} THEN 1 ELSE 0 END), 0),
+            {distinct_pk_expression}
+        FROM {target_table}
+    """
+    cursor = connection.execute(integrity_query)
+    actual_row_count, null_count, distinct_pk_count = cursor.fetchone()
 
+    # ------------------------------------------------------------------
+    # Row count validation
+    # ------------------------------------------------------------------
     if actual_row_count != expected_row_count:
         raise ValueError(
             f"Row count mismatch after LOAD for {table_name}: "
@@ -175,13 +222,6 @@ def _validate_data_integrity(
     # ------------------------------------------------------------------
     # NULL check on primary key
     # ------------------------------------------------------------------
-    null_pk_query = (
-        f"SELECT COUNT(*) FROM {table_name} WHERE " +
-        " OR ".join([f"{pk} IS NULL" for pk in primary_key])
-    )
-    cursor = connection.execute(null_pk_query)
-    null_count = cursor.fetchone()[0]
-
     if null_count > 0:
         raise ValueError(
             f"NULL values found in primary key {primary_key} "
@@ -191,18 +231,7 @@ def _validate_data_integrity(
     # ------------------------------------------------------------------
     # Duplicate primary key check
     # ------------------------------------------------------------------
-    dup_query = f"""
-        SELECT COUNT(*) FROM (
-            SELECT {", ".join(primary_key)}
-            FROM {table_name}
-            GROUP BY {", ".join(primary_key)}
-            HAVING COUNT(*) > 1
-        )
-    """
-    cursor = connection.execute(dup_query)
-    dup_count = cursor.fetchone()[0]
-
-    if dup_count > 0:
+    if distinct_pk_count != actual_row_count:
         raise ValueError(
             f"Duplicate primary keys detected after LOAD for table={table_name}"
         )
@@ -210,17 +239,79 @@ def _validate_data_integrity(
     logger.info("Post-load integrity validation passed for table=%s", table_name)
 
 
+def _quote_identifier(name: str) -> str:
+    """
+    Quote a SQLite identifier so reserved words and odd names are safe.
+
+    :param name: Table or column name
+    :return: Double-quoted identifier
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+@lru_cache(maxsize=_STMT_CACHE_SIZE)
+def _get_insert_statement(
+    table: str,
+    column_list: str,
+    column_count: int,
+    row_count: int
+) -> str:
+    """
+    Return the multi-row INSERT statement for a chunk shape.
+
+    Reusing the identical SQL string lets sqlite3's per-connection statement
+    cache skip re-parsing; only the trailing partial chunk has a new shape.
+    The LRU bound keeps one-off partial-chunk statements from piling up.
+
+    :param table: Quoted target table
+    :param column_list: Quoted, comma-separated column list
+    :param column_count: Number of columns per row
+    :param row_count: Number of rows in the chunk
+    :return: INSERT statement with positional placeholders
+    """
+    row_placeholders = "(" + ", ".join(["?"] * column_count) + ")"
+    return (
+        f"INSERT INTO {table} ({column_list}) VALUES "
+        + ", ".join([row_placeholders] * row_count)
+    )
+
+
+def _iter_insert_chunks(
+    data: pd.DataFrame,
+    chunk_size: int
+) -> Iterator[Tuple[int, List[Any]]]:
+    """
+    Lazily yield flattened insert parameters one chunk at a time.
+
+    Type normalization and the object-array conversion happen per chunk, so
+    only one chunk of bound Python values is resident at any point.
+
+    :param data: DataFrame to be loaded
+    :param chunk_size: Maximum rows per chunk
+    :return: Iterator of (row_count, flat parameter list) per chunk
+    """
+    for start in range(0, len(data), chunk_size):
+        chunk = _normalize_sqlite_types(data.iloc[start:start + chunk_size])
+        values = chunk.to_numpy(dtype=object)
+        yield len(values), values.ravel().tolist()
+
+
 def _normalize_sqlite_types(data: pd.DataFrame) -> pd.DataFrame:
     """
-    Function is coverting pandas timestamp columns to sqlite iso format
-    :param data:
-    :return:
+    Convert datetime columns to SQLite ISO-8601 text.
+
+    Columns are selected by dtype and formatted with a vectorized strftime;
+    timezone-aware columns keep their UTC offset (matching Timestamp.isoformat).
+
+    :param data: DataFrame to be loaded
+    :return: DataFrame with datetime columns rendered as ISO-8601 strings
     """
-    data = data.copy()
+    data = data.copy(deep=False)
+
+    for col in data.select_dtypes(include=["datetime", "datetimetz"]).columns:
+        iso_format = "%Y-%m-%dT%H:%M:%S"
+        if data[col].dt.tz is not None:
+            iso_format += "%:z"
+        data[col] = data[col].dt.strftime(iso_format)
 
-    for col in data.columns:
-        if data[col].apply(lambda x: isinstance(x, pd.Timestamp)).any():
-            data[col] = data[col].apply(
-                lambda x: x.isoformat() if isinstance(x, pd.Timestamp) else x
-            )
     return data
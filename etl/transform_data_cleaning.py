@@ -38,8 +38,12 @@ import logging
 import re
 from typing import List, Dict, Any
 
+import numpy as np
 import pandas as pd
 
+_RE_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_RE_REPEATED_UNDERSCORE = re.compile(r"_+")
+
 
 # ==================================================================================================
 # Transform Tasks - Phase 1 - Clean
@@ -54,11 +58,16 @@ def _standardize_column_names(data: pd.DataFrame, logger: logging.Logger) -> Non
     """
     logger.info("Standardizing column names")
 
-    normalized_columns = []
-    for column in data.columns:
-        new_name = _normalize_column_name(column)
-        logger.info("Column rename: %s -> %s", column, new_name)
-        normalized_columns.append(new_name)
+    original_columns = data.columns
+    normalized_columns = (
+        original_columns.astype(str)
+        .str.strip()
+        .str.lower()
+        .str.replace(_RE_NON_ALNUM, "_", regex=True)
+        .str.replace(_RE_REPEATED_UNDERSCORE, "_", regex=True)
+        .str.strip("_")
+    )
+    logger.info("Column renames: %s", dict(zip(original_columns, normalized_columns)))
 
     data.columns = normalized_columns
 
@@ -83,17 +92,18 @@ def _handle_missing_values(
     """
     logger.info("Handling missing values")
 
-    before_count = len(data)
-    data.dropna(subset=primary_key, inplace=True)
-
-    dropped = before_count - len(data)
-    if dropped > 0:
-        logger.info("Dropped %d rows due to NULL primary keys", dropped)
+    # Single boolean mask across all PK columns; rows are dropped only when needed
+    null_pk_mask = np.zeros(len(data), dtype=bool)
+    for col in primary_key:
+        null_pk_mask |= data[col].isna().to_numpy()
 
-    for col, default in column_default_map.items():
-        if col in data.columns and data[col].isna().any():
-            logger.info("Filling NULLs in column '%s' with default '%s'", col, default)
+    if null_pk_mask.any():
+        logger.info("Dropped %d rows due to NULL primary keys", int(null_pk_mask.sum()))
+        # dropna works by position, so rows sharing an index label survive
+        data.dropna(subset=primary_key, inplace=True)
 
+    # fillna is a no-op on columns without NULLs, so no per-column probe is needed
+    logger.info("Filling NULLs with defaults for columns=%s", list(column_default_map))
     data.fillna(value=column_default_map, inplace=True)
 
 
@@ -135,9 +145,16 @@ def _convert_data_types(
     logger.info("Converting column data types")
 
     for col, dtype in column_types_map.items():
-        logger.info("Converting column '%s' to type '%s'", col, dtype)
+        if data[col].dtype == dtype:
+            logger.info("Column '%s' already of type '%s', skipping", col, dtype)
+            continue
 
-    data = data.astype(dtype=column_types_map, errors="raise")
+        logger.info("Converting column '%s' to type '%s'", col, dtype)
+        if "datetime" in str(dtype):
+            # cache=True parses each distinct date string only once
+            data[col] = pd.to_datetime(data[col], cache=True).astype(dtype)
+        else:
+            data[col] = data[col].astype(dtype, errors="raise")
 
 
 # ==================================================================================================
@@ -177,19 +194,3 @@ def run_transform_data_cleaning(
     except Exception:
         logger.exception("CLEAN TRANSFORM (T1) failed for source=%s", source_name)
         raise
-
-
-# ==================================================================================================
-# Transform Helpers - Phase 1 - Clean
-# ==================================================================================================
-def _normalize_column_name(column: str) -> str:
-    """
-    Normalize a column name to deterministic snake_case.
-
-    :param column: Raw column name
-    :return: Normalized column name
-    """
-    column = column.strip().lower()
-    column = re.sub(r"[^a-z0-9]+", "_", column)
-    column = re.sub(r"_+", "_", column)
-    return column.strip("_")
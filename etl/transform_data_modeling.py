@@ -26,6 +26,7 @@ Scope & Responsibilities
 Design Notes
 ------------------------------------------------------------------------------------
 - Operates on single DataFrame inputs
+- Builders shallow-copy their input: existing columns are shared, never mutated in place
 - All functions are deterministic
 - No database access
 - No orchestration logic (handled externally)
@@ -34,10 +35,33 @@ Design Notes
 
 import logging
 import re
-from typing import List, Dict
+from typing import Callable, List, Dict, Tuple
 
+import numpy as np
 import pandas as pd
 
+# Bucket edges are right-inclusive: price <= 500 is LOW, <= 2000 is MEDIUM
+_PRICE_BINS = [-np.inf, 500, 2000, np.inf]
+_PRICE_LABELS = ["LOW", "MEDIUM", "HIGH"]
+
+# Tenure days <= 90 is NEW, <= 365 is REGULAR
+_TENURE_BINS = [-np.inf, 90, 365, np.inf]
+_TENURE_LABELS = ["NEW", "REGULAR", "LOYAL"]
+
+_METRO_CITIES = frozenset({"MUMBAI", "DELHI", "BANGALORE", "CHENNAI"})
+
+_RE_SNAKE_CASE = re.compile(r"^[a-z0-9]+(?:_[a-z0-9]+)*$")
+
+# Column names that already passed the snake_case check in this process
+_VALIDATED_COLUMN_NAMES = set()
+
+# pyarrow (optional) backs string ops with Arrow compute kernels; fall back to the default storage
+try:
+    import pyarrow  # noqa: F401
+    _TEXT_DTYPE = "string[pyarrow]"
+except ImportError:
+    _TEXT_DTYPE = "string"
+
 # ==================================================================================================
 # Dimension Builders
 # ==================================================================================================
@@ -61,21 +85,34 @@ def _build_customers_dim(
     """
     logger.info("Building customers_dim for source=%s", source_name)
 
-    data = data[expected_columns].copy()
+    data = data[expected_columns].copy(deep=False)
 
     data["customer_full_name"] = (
-        data["first_name"].fillna("") + " " + data["last_name"].fillna("")
-    ).str.strip()
+        data["first_name"].astype(_TEXT_DTYPE)
+        .str.cat(data["last_name"].astype(_TEXT_DTYPE), sep=" ", na_rep="")
+        .str.strip()
+    )
+
+    # Tenure is date-granular: subtract UTC calendar days directly; NaT signups stay NaN
+    as_of_day = pd.Timestamp(kwargs["as_of_date"]).tz_convert("UTC").tz_localize(None)
+    signup_days = _as_utc(data["signup_date"]).dt.tz_localize(None).to_numpy("datetime64[D]")
+    tenure_days = (np.datetime64(as_of_day, "D") - signup_days).astype(np.int64)
 
+    missing_signup = np.isnat(signup_days)
     data["customer_tenure_days"] = (
-            kwargs["as_of_date"] - pd.to_datetime(data["signup_date"], utc=True)
-    ).dt.days
-    data["customer_tenure_bucket"] = data["customer_tenure_days"].apply(
-        _assign_customer_tenure_bucket
+        np.where(missing_signup, np.nan, tenure_days) if missing_signup.any() else tenure_days
+    )
+    data["customer_tenure_bucket"] = pd.cut(
+        data["customer_tenure_days"], bins=_TENURE_BINS, labels=_TENURE_LABELS
     )
 
-    data["email_domain"] = data["email"].str.split("@").str[1]
-    derived_columns = [column for column in data.columns if column not in expected_columns]
+    data["email_domain"] = _email_domain(data["email"])
+    derived_columns = [
+        "customer_full_name",
+        "customer_tenure_days",
+        "customer_tenure_bucket",
+        "email_domain"
+    ]
 
     return data, derived_columns
 
@@ -99,13 +136,16 @@ def _build_products_dim(
     """
     logger.info("Building products_dim for source=%s", source_name)
 
-    data = data[expected_columns].copy()
+    data = data[expected_columns].copy(deep=False)
 
-    data["price_band"] = data["price"].apply(_assign_band)
-    data["is_premium_product"] = data["price"] > 2000
+    data["price_band"] = pd.cut(data["price"], bins=_PRICE_BINS, labels=_PRICE_LABELS)
+
+    # price > 2000 is exactly the HIGH band, so reuse the bin codes instead of rescanning price
+    price_codes = data["price_band"].cat.codes.to_numpy()
+    data["is_premium_product"] = price_codes == _PRICE_LABELS.index("HIGH")
     data["category_normalized"] = data["category"].str.upper()
 
-    derived_columns = [column for column in data.columns if column not in expected_columns]
+    derived_columns = ["price_band", "is_premium_product", "category_normalized"]
     return data, derived_columns
 
 
@@ -123,28 +163,39 @@ def _build_stores_dim(
     :param source_name: Source identifier
     :param data: Clean input DataFrame
     :param expected_columns: Final schema columns
-    :param state_region_map: Mapping of state code to region
+    :param state_region_keys: State codes (Index, aligned with state_region_values)
+    :param state_region_values: Region per state code
     :param logger: Shared ETL logger
     :return: stores_dim DataFrame
     """
     logger.info("Building stores_dim for source=%s", source_name)
 
-    data = data[expected_columns].copy()
+    data = data[expected_columns].copy(deep=False)
 
-    data["city"] = data["city"].str.upper()
-    data["state"] = data["state"].str.upper()
+    # Both columns are upper-cased per distinct value and stay categorical for the lookups below
+    data["city"] = _upper_categorical(data["city"])
+    data["state"] = _upper_categorical(data["state"])
 
-    metro_cities = {"MUMBAI", "DELHI", "BANGALORE", "CHENNAI"}
-    data["is_metro_store"] = data["city"].isin(metro_cities)
+    # Membership is resolved once per distinct city, then gathered by category code
+    city_codes = data["city"].cat.codes.to_numpy()
+    metro_categories = data["city"].cat.categories.isin(_METRO_CITIES)
+    data["is_metro_store"] = np.where(city_codes >= 0, metro_categories[city_codes], False)
 
-    data["store_region"] = data["state"].map(kwargs["state_region_map"])
+    # Regions are resolved once per distinct state, then gathered by category code;
+    # unknown (or missing) states resolve to -1, so the unmapped check needs no extra scan
+    region_index = kwargs["state_region_keys"].get_indexer(data["state"].cat.categories)
+    state_codes = data["state"].cat.codes.to_numpy()
+    region_codes = np.where(state_codes >= 0, region_index[state_codes], -1)
 
-    if data["store_region"].isna().any():
-        unmapped = data.loc[data["store_region"].isna(), "state"].unique()
+    unmapped_mask = region_codes == -1
+    if unmapped_mask.any():
+        unmapped = data.loc[unmapped_mask, "state"].unique()
         logger.error("Unmapped states found: %s", unmapped)
         raise ValueError("Unmapped states found while deriving store_region")
 
-    derived_columns = [column for column in data.columns if column not in expected_columns]
+    data["store_region"] = kwargs["state_region_values"][region_codes]
+
+    derived_columns = ["is_metro_store", "store_region"]
     return data, derived_columns
 
 
@@ -170,18 +221,41 @@ def _build_sales_fact(
     """
     logger.info("Building sales_fact for source=%s", source_name)
 
-    data = data[expected_columns].copy()
+    data = data[expected_columns].copy(deep=False)
 
-    data["gross_amount"] = data["quantity"] * data["unit_price"]
-    data["discount_amount"] = data["gross_amount"] * (data["discount_pct"] / 100)
-    data["net_amount"] = data["gross_amount"] - data["discount_amount"]
-    data["is_discounted"] = data["discount_pct"] > 0
+    quantity = data["quantity"].to_numpy()
+    unit_price = data["unit_price"].to_numpy()
+    discount_pct = data["discount_pct"].to_numpy()
 
-    data["sale_date"] = pd.to_datetime(data["sale_date"], utc=True)
-    data["order_year"] = data["sale_date"].dt.year
-    data["order_month"] = data["sale_date"].dt.strftime("%Y-%m")
+    gross_amount, discount_amount, net_amount = _compute_sales_amounts(
+        quantity, unit_price, discount_pct
+    )
+    sale_date = _as_utc(data["sale_date"])
+
+    # Only the few distinct months are formatted as 'YYYY-MM', then gathered by code;
+    # NaT gets code -1, which picks the trailing None
+    month_codes, months = pd.factorize(sale_date.dt.tz_localize(None).dt.to_period("M"))
+    month_labels = np.append(months.strftime("%Y-%m").to_numpy(dtype=object), None)
+
+    # All derived columns are attached in a single assign
+    data = data.assign(
+        gross_amount=gross_amount,
+        discount_amount=discount_amount,
+        net_amount=net_amount,
+        is_discounted=discount_pct > 0,
+        sale_date=sale_date,
+        order_year=sale_date.dt.year,
+        order_month=month_labels[month_codes]
+    )
 
-    derived_columns = [column for column in data.columns if column not in expected_columns]
+    derived_columns = [
+        "gross_amount",
+        "discount_amount",
+        "net_amount",
+        "is_discounted",
+        "order_year",
+        "order_month"
+    ]
     return data, derived_columns
 
 
@@ -204,18 +278,41 @@ def build_date_dim(
     logger.info("Building date_dim")
 
     dates = pd.date_range(start=min_date, end=max_date)
-    date_dim = pd.DataFrame({"date": dates})
 
-    date_dim["year"] = date_dim["date"].dt.year
-    date_dim["month"] = date_dim["date"].dt.month
-    date_dim["year_month"] = date_dim["date"].dt.strftime("%Y-%m")
-    date_dim["day_of_week"] = date_dim["date"].dt.dayofweek
-    date_dim["is_weekend"] = date_dim["day_of_week"].isin([5, 6])
-    date_dim["quarter"] = date_dim["date"].dt.quarter
+    # All calendar fields come from one datetime64[D] buffer (local wall-clock days) via
+    # NumPy unit casts and integer arithmetic; 1970-01-01 (day 0) was a Thursday
+    days = dates.tz_localize(None).to_numpy().astype("datetime64[D]")
+    year = (days.astype("datetime64[Y]").astype(np.int64) + 1970).astype(np.int16)
+    month = (days.astype("datetime64[M]").astype(np.int64) % 12 + 1).astype(np.int8)
+    day_of_week = ((days.astype(np.int64) + 3) % 7).astype(np.int8)
+
+    year_month = np.char.add(
+        np.char.add(year.astype("U4"), "-"),
+        np.char.zfill(month.astype("U2"), 2)
+    )
+
+    date_dim = pd.DataFrame({
+        "date": dates,
+        "year": year,
+        "month": month,
+        "year_month": year_month,
+        "day_of_week": day_of_week,
+        "is_weekend": day_of_week >= 5,
+        "quarter": (month - 1) // 3 + 1
+    })
 
     return date_dim
 
 
+# Source name -> table builder, resolved once at import
+_BUILDERS: Dict[str, Callable[..., Tuple[pd.DataFrame, List[str]]]] = {
+    "sales": _build_sales_fact,
+    "products": _build_products_dim,
+    "customers": _build_customers_dim,
+    "stores": _build_stores_dim,
+}
+
+
 # ==================================================================================================
 # Execute Transform - Phase 2
 # ==================================================================================================
@@ -243,17 +340,11 @@ def run_transform_data_modeling(
 
         row_count_before = len(data)
 
-        builders = {
-            "sales": _build_sales_fact,
-            "products": _build_products_dim,
-            "customers": _build_customers_dim,
-            "stores": _build_stores_dim,
-        }
-
-        if source_name not in builders:
+        builder = _BUILDERS.get(source_name)
+        if builder is None:
             raise ValueError(f"Invalid source name: {source_name}")
 
-        data, derived_columns = builders[source_name](
+        data, derived_columns = builder(
             source_name,
             data,
             expected_columns,
@@ -309,7 +400,8 @@ def _validate_data_integrity(
     # ------------------------------------------------------------------
     # NULL check on primary key
     # ------------------------------------------------------------------
-    nulls_on_pk = data[primary_key].isna().any().any()
+    pk_data = data[primary_key]
+    nulls_on_pk = pk_data.isna().to_numpy().any()
     logger.info("Null check on primary key passed=%s", not nulls_on_pk)
 
     if nulls_on_pk:
@@ -323,7 +415,12 @@ def _validate_data_integrity(
     # ------------------------------------------------------------------
     # Duplicate check on primary key
     # ------------------------------------------------------------------
-    has_duplicates = data.duplicated(subset=primary_key, keep=False).any()
+    # Key hashes are compared first; a hash collision is confirmed with an exact check
+    pk_hashes = pd.util.hash_pandas_object(pk_data, index=False).to_numpy()
+    has_duplicates = (
+        np.unique(pk_hashes).size != len(pk_hashes)
+        and pk_data.duplicated(keep=False).any()
+    )
     logger.info("Duplicate primary key check passed=%s", not has_duplicates)
 
     if has_duplicates:
@@ -354,51 +451,110 @@ def _validate_data_integrity(
     # ------------------------------------------------------------------
     # Schema validation
     # ------------------------------------------------------------------
-    read_columns = sorted(data.columns.tolist())
-    expected_columns_sorted = sorted(expected_columns + derived_columns)
+    # Set equality plus a length check also catches duplicated column names
+    schema_columns = expected_columns + derived_columns
 
-    logger.info("Expected columns=%s", expected_columns_sorted)
-    logger.info("Read columns=%s", read_columns)
+    logger.debug("Expected columns=%s", schema_columns)
+    logger.debug("Read columns=%s", list(data.columns))
 
-    if read_columns != expected_columns_sorted:
+    if len(data.columns) != len(schema_columns) or set(data.columns) != set(schema_columns):
         logger.error(
             "Schema mismatch for source=%s. Expected=%s, Found=%s",
             source_name,
-            expected_columns_sorted,
-            read_columns
+            sorted(schema_columns),
+            sorted(data.columns)
         )
         raise ValueError(f"Schema mismatch detected for {source_name}")
 
     # ------------------------------------------------------------------
     # Snake case validation
     # ------------------------------------------------------------------
-    pattern = r"^[a-z0-9]+(?:_[a-z0-9]+)*$"
+    # Column sets are fixed by pipeline_config, so each name is only matched once per process
     for col in data.columns:
-        if re.fullmatch(pattern, col) is None:
+        if col in _VALIDATED_COLUMN_NAMES:
+            continue
+        if _RE_SNAKE_CASE.fullmatch(col) is None:
             logger.error(
                 "Invalid column name detected for source=%s: %s",
                 source_name,
                 col
             )
             raise ValueError(f"Invalid column name detected: {col}")
+        _VALIDATED_COLUMN_NAMES.add(col)
 
     logger.info("T2 data integrity validation passed for source=%s", source_name)
 
 
 # ==================================================================================================
-# Helper Functions
+# Model Helpers
 # ==================================================================================================
-def _assign_band(price: float) -> str:
-    if price <= 500:
-        return "LOW"
-    elif price <= 2000:
-        return "MEDIUM"
-    return "HIGH"
-
-
-def _assign_customer_tenure_bucket(days: int) -> str:
-    if days <= 90:
-        return "NEW"
-    elif days <= 365:
-        return "REGULAR"
-    return "LOYAL"
+def _as_utc(values: pd.Series) -> pd.Series:
+    """
+    Attach (or convert to) UTC on a datetime column already typed by T1.
+
+    Localizing is a metadata change, unlike re-parsing through pd.to_datetime.
+
+    :param values: datetime64 Series, naive or tz-aware
+    :return: UTC tz-aware Series
+    """
+    if values.dt.tz is None:
+        return values.dt.tz_localize("UTC")
+    return values.dt.tz_convert("UTC")
+
+
+def _email_domain(emails: pd.Series) -> pd.Series:
+    """
+    Return the text between the first and second '@' (split("@").str[1]).
+
+    Built from two partition passes, which yield fixed columns instead of a
+    per-row list; values without '@' (including "") come back as NULL.
+
+    :param emails: Email addresses
+    :return: Email domains, NULL where there is no '@'
+    """
+    head = emails.astype(_TEXT_DTYPE).str.partition("@")
+    domain = head[2].str.partition("@")[0]
+    return domain.where(head[1].eq("@").fillna(False))
+
+
+def _upper_categorical(values: pd.Series) -> pd.Series:
+    """
+    Upper-case a text column as a categorical, hashing only its distinct values.
+
+    Categories that collide after upper-casing (e.g. 'Pune' and 'PUNE') are merged.
+
+    :param values: Text or categorical Series
+    :return: Categorical Series of upper-cased values
+    """
+    values = values.astype("category")
+    upper_codes, upper_categories = pd.factorize(
+        values.cat.categories.astype("string").str.upper()
+    )
+
+    # Missing values (code -1) pick the trailing -1
+    codes = np.append(upper_codes, -1)[values.cat.codes.to_numpy()]
+
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=upper_categories),
+        index=values.index,
+        name=values.name
+    )
+
+
+def _compute_sales_amounts(
+    quantity: np.ndarray,
+    unit_price: np.ndarray,
+    discount_pct: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute gross, discount and net amounts for sales rows.
+
+    :param quantity: Quantity per row
+    :param unit_price: Unit price per row
+    :param discount_pct: Discount percentage per row
+    :return: Tuple of (gross_amount, discount_amount, net_amount) arrays
+    """
+    gross_amount = quantity * unit_price
+    discount_amount = gross_amount * (discount_pct / 100)
+
+    return gross_amount, discount_amount, gross_amount - discount_amount
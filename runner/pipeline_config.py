@@ -8,7 +8,9 @@ pipeline runner.
 It acts as the **single source of truth** for pipeline inputs, schema contracts,
 and reference mappings used across Extract, Transform, and Load stages.
 
-No executable logic is defined here.
+Apart from lookup structures derived from these constants at import time
+(PROFILES, STATE_REGION_KEYS / STATE_REGION_VALUES), no executable logic is
+defined here.
 
 ------------------------------------------------------------------------------------
 Configuration Coverage
@@ -17,20 +19,24 @@ Pipeline Inputs:
 - FILE_PATHS          : Source file locations per pipeline
 - TABLE_NAMES         : Logical pipeline name → warehouse table mapping
 - AS_OF_DATE          : Reference timestamp for deterministic time-based derivations
+- PIPELINES           : Pipeline names in load order (PIPELINES_SET for membership checks)
+- PROFILES            : Per-pipeline file/table/schema settings, resolved once at import
 
 Schema Contracts:
 - EXPECTED_COLUMNS    : Authoritative column list per warehouse table
 - PRIMARY_KEYS        : Primary key definition per table
-- DATA_TYPE_MAP       : Data type enforcement map (Clean phase only)
+- DATA_TYPE_MAP       : Data type enforcement map (low-cardinality text as "category")
 - DEFAULT_VALUE_MAP   : Default fill values for non-PK columns (Clean phase)
 
 Reference Data:
 - STATE_REGION_MAP    : State → region mapping for stores dimension
+- STATE_REGION_KEYS   : State codes of STATE_REGION_MAP as an Index (for get_indexer)
+- STATE_REGION_VALUES : Regions aligned with STATE_REGION_KEYS
 
 ------------------------------------------------------------------------------------
 Design Notes
 ------------------------------------------------------------------------------------
-- This module contains **constants only**
+- This module contains **constants** and lookups derived from them once at import
 - No imports from ETL logic modules
 - Safe to import across runner, orchestration, and tests
 - Changes here affect pipeline behavior without code changes elsewhere
@@ -40,6 +46,10 @@ Design Notes
 
 from datetime import datetime, timezone
 from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
 
 # ==================================================================================================
 # Arguments / parameters required by each stage
@@ -131,22 +141,22 @@ DATA_TYPE_MAP = {
         "first_name": "string",
         "last_name": "string",
         "email": "string",
-        "city": "string",
+        "city": "category",
         "signup_date": "datetime64[ns]"
     },
 
     "products_dim": {
         "product_id": "string",
         "product_name": "string",
-        "category": "string",
+        "category": "category",
         "price": "float64"
     },
 
     "stores_dim": {
         "store_id": "string",
         "store_name": "string",
-        "city": "string",
-        "state": "string"
+        "city": "category",
+        "state": "category"
     },
 
     "sales_fact": {
@@ -217,6 +227,10 @@ STATE_REGION_MAP = {
     "LA": "NORTH"
 }
 
+# state_region_map as aligned lookup arrays, built once at import
+STATE_REGION_KEYS = pd.Index(list(STATE_REGION_MAP))
+STATE_REGION_VALUES = np.array(list(STATE_REGION_MAP.values()), dtype=object)
+
 
 # as_of_date
 AS_OF_DATE = datetime.now(timezone.utc)
@@ -246,5 +260,17 @@ FILE_PATHS = {
 
 # pipelines
 PIPELINES = ["customers", "products", "stores", "sales"]
-
-
+PIPELINES_SET = frozenset(PIPELINES)
+
+# per-pipeline settings resolved once at import (pipeline name -> profile)
+PROFILES = {
+    pipeline_name: SimpleNamespace(
+        file_path=FILE_PATHS[pipeline_name],
+        table_name=TABLE_NAMES[pipeline_name],
+        expected_columns=EXPECTED_COLUMNS[TABLE_NAMES[pipeline_name]],
+        primary_key=PRIMARY_KEYS[TABLE_NAMES[pipeline_name]],
+        column_defaults=DEFAULT_VALUE_MAP[TABLE_NAMES[pipeline_name]],
+        column_types=DATA_TYPE_MAP[TABLE_NAMES[pipeline_name]]
+    )
+    for pipeline_name in PIPELINES
+}
@@ -9,6 +9,7 @@ It is responsible for:
 - Validating pipeline inputs
 - Managing control-plane logging (run + stage logs)
 - Executing Extract → Transform → Load stages in order
+- Running Extract + Transform of multiple pipelines in parallel worker processes
 - Handling pipeline-specific behavior (e.g., sales date_dim)
 - Managing database connections and failure handling
 
@@ -18,18 +19,27 @@ This module contains **no transformation logic** and acts purely as an orchestra
 Design Notes
 ------------------------------------------------------------------------------------
 - One pipeline run = one run_id
+- Loads are always serialized on a single warehouse connection
+- SQLite connections are opened once per process and reused across runs
 - Each stage logs STARTED and terminal state (SUCCESS / FAILED)
+- Stage records are buffered per phase and written in one batch when the phase ends
 - Stage modules raise exceptions; runner records failures
 - Metadata tables are NOT modified here
 ------------------------------------------------------------------------------------
 """
 
 import argparse
+import atexit
 import logging
+import os
 import sqlite3
-import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict, List, Any
+from pathlib import Path
+from typing import AbstractSet, Dict, Iterator, List, Any, Tuple
+
+import pandas as pd
 
 from etl import (
     extract,
@@ -41,6 +51,9 @@ from runner import pipeline_config as config
 from utils import log_table_helpers
 from utils import text_logger
 
+# Open SQLite connections keyed by (db_path, pid); reused across pipeline runs
+_CONNECTIONS: Dict[Tuple[str, int], sqlite3.Connection] = {}
+
 
 # ============================================================================================
 # Main module to call pipelines
@@ -52,56 +65,173 @@ def main():
     pipeline_name = user_input["pipeline_name"]
     dry_run = user_input["dry_run"]
 
-    if not dry_run:
-        run_pipeline(pipeline_name)
+    if pipeline_name == "all":
+        run_pipelines(config.PIPELINES, dry_run=dry_run)
+    else:
+        run_pipeline(pipeline_name, dry_run=dry_run)
 
 
 # ============================================================================================
 # Run pipeline
 # ============================================================================================
-def run_pipeline(pipeline_name: str) -> None:
+def run_pipeline(
+    pipeline_name: str,
+    dry_run: bool = False,
+    batch_size: int = load.LOAD_BATCH_SIZE
+) -> None:
     """
     Execute an end-to-end ETL pipeline for a given source.
 
     :param pipeline_name: Logical pipeline name (customers, products, stores, sales)
+    :param dry_run: Only validate config + connectivity, run no stages
+    :param batch_size: Maximum rows per INSERT statement during LOAD
     :return: None
     """
     run_id = _get_run_id()
+    if dry_run:
+        _run_dry_run(pipeline_name, run_id)
+        return
+
+    modeled = _run_transform_phase(pipeline_name, run_id)
+    _run_load_phase(pipeline_name, run_id, modeled, batch_size)
+
+
+def run_pipelines(
+    pipeline_names: List[str],
+    max_workers: int = 4,
+    dry_run: bool = False,
+    batch_size: int = load.LOAD_BATCH_SIZE
+) -> None:
+    """
+    Execute several pipelines with Extract + Transform running in parallel.
+
+    Extract, T1 and T2 of each pipeline run in a worker process (sources share
+    no state). Loads are then executed serially in the given order on a single
+    warehouse connection, so dimensions must precede facts in pipeline_names.
+
+    :param pipeline_names: Logical pipeline names, in load order
+    :param max_workers: Number of worker processes for Extract + Transform
+    :param dry_run: Only validate config + connectivity, run no stages
+    :param batch_size: Maximum rows per INSERT statement during LOAD
+    :return: None
+    :raises: RuntimeError if any pipeline failed
+    """
+    if dry_run:
+        for pipeline_name in pipeline_names:
+            _run_dry_run(pipeline_name, _get_run_id())
+        return
+
+    run_ids = {pipeline_name: _get_run_id() for pipeline_name in pipeline_names}
+    failed = []
+
+    # Workers log through the parent, which alone writes the log file
+    with text_logger.worker_log_queue() as log_queue, ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=text_logger.init_worker,
+        initargs=(log_queue,)
+    ) as executor:
+        futures = {
+            pipeline_name: executor.submit(
+                _run_transform_phase, pipeline_name, run_ids[pipeline_name]
+            )
+            for pipeline_name in pipeline_names
+        }
+
+        for pipeline_name in pipeline_names:
+            try:
+                modeled = futures[pipeline_name].result()
+                _run_load_phase(
+                    pipeline_name, run_ids[pipeline_name], modeled, batch_size
+                )
+            except Exception:
+                # Failure is already recorded in the control DB and text log
+                failed.append(pipeline_name)
+
+    if failed:
+        raise RuntimeError(f"Pipelines failed: {failed}")
+
+
+def _run_dry_run(pipeline_name: str, run_id: str) -> None:
+    """
+    Validate a pipeline's config and ping both databases without running stages.
+
+    No run or stage records are written.
+
+    :param pipeline_name: Logical pipeline name
+    :param run_id: Run id used only to tag log lines
+    :return: None
+    """
     logger = text_logger.get_logger(run_id, pipeline_name)
-    file_path = None
+    logger.info("Dry-run started")
+
+    _is_pipeline_valid(pipeline_name, config.PIPELINES_SET, logger)
+    profile = config.PROFILES[pipeline_name]
+    if not profile.file_path.exists():
+        raise FileNotFoundError(f"Source file not found: {profile.file_path}")
+
+    for db_path in (config.CONTROL_DB_PATH, config.RETAIL_SALES_DB_PATH):
+        _ping_read_only(db_path)
+        logger.info("Connectivity OK | db_path=%s", db_path)
+
+    logger.info("Dry-run OK")
+
+
+def _ping_read_only(db_path: str) -> None:
+    """
+    Open a database read-only, run SELECT 1 and close it.
+
+    Skips the cached connection and its tuning PRAGMAs, so a dry run never
+    switches the journal mode or creates a missing database file.
+
+    :param db_path: SQLite database path
+    :return: None
+    """
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True)
+    try:
+        conn.execute("SELECT 1").fetchone()
+    finally:
+        conn.close()
+
+
+def _run_transform_phase(pipeline_name: str, run_id: str) -> pd.DataFrame:
+    """
+    Run EXTRACT, TRANSFORM_P1 and TRANSFORM_P2 for a pipeline run.
+
+    Opens its own control connection so it can execute in a worker process.
+
+    :param pipeline_name: Logical pipeline name
+    :param run_id: Pipeline run id
+    :return: Modeled (T2) DataFrame
+    """
+    logger = text_logger.get_logger(run_id, pipeline_name)
+    info_enabled = logger.isEnabledFor(logging.INFO)
     control_connection = None
-    warehouse_connection = None
-    stage_data = None
+    run_data = None
+    stage_log = []
 
     try:
         logger.info("Pipeline invocation started")
-        logger.info("Pipeline name=%s, run_id=%s", pipeline_name, run_id)
+        if info_enabled:
+            logger.info("Pipeline name=%s, run_id=%s", pipeline_name, run_id)
 
         # ------------------------------------------------------------------
         # Validate pipeline
         # ------------------------------------------------------------------
         logger.info("Validating pipeline name")
-        _is_pipeline_valid(pipeline_name, config.PIPELINES, logger)
+        _is_pipeline_valid(pipeline_name, config.PIPELINES_SET, logger)
         logger.info("Pipeline validation successful")
 
         # ------------------------------------------------------------------
-        # Connect to databases
+        # Connect to control database
         # ------------------------------------------------------------------
-        logger.info("Connecting to control database at path=%s", config.CONTROL_DB_PATH)
+        if info_enabled:
+            logger.info("Connecting to control database at path=%s", config.CONTROL_DB_PATH)
         control_connection = _get_control_connection(
             config.CONTROL_DB_PATH, logger
         )
         logger.info("Connected to control database")
 
-        logger.info(
-            "Connecting to warehouse database at path=%s",
-            config.RETAIL_SALES_DB_PATH
-        )
-        warehouse_connection = _get_warehouse_connection(
-            config.RETAIL_SALES_DB_PATH, logger
-        )
-        logger.info("Connected to warehouse database")
-
         # ------------------------------------------------------------------
         # Create pipeline run
         # ------------------------------------------------------------------
@@ -118,129 +248,149 @@ def run_pipeline(pipeline_name: str) -> None:
         # Fetch pipeline configuration
         # ------------------------------------------------------------------
         logger.info("Fetching pipeline configuration")
-        file_path = config.FILE_PATHS[pipeline_name]
-        table_name = config.TABLE_NAMES[pipeline_name]
-        expected_columns = config.EXPECTED_COLUMNS[table_name]
-        primary_key = config.PRIMARY_KEYS[table_name]
-        column_defaults = config.DEFAULT_VALUE_MAP[table_name]
-        column_types = config.DATA_TYPE_MAP[table_name]
-
-        logger.info(
-            "Pipeline config resolved | file_path=%s | table=%s | pk=%s",
-            file_path,
-            table_name,
-            primary_key
-        )
+        profile = config.PROFILES[pipeline_name]
+        file_path = profile.file_path
+        table_name = profile.table_name
+        expected_columns = profile.expected_columns
+        primary_key = profile.primary_key
+        column_defaults = profile.column_defaults
+        column_types = profile.column_types
+
+        if info_enabled:
+            logger.info(
+                "Pipeline config resolved | file_path=%s | table=%s | pk=%s",
+                file_path,
+                table_name,
+                primary_key
+            )
 
         # ------------------------------------------------------------------
         # EXTRACT
         # ------------------------------------------------------------------
         logger.info("Starting EXTRACT stage")
-        stage_data = _insert_stage(
-            control_connection,
-            run_id,
-            "EXTRACT",
-            "STARTED",
-            None
-        )
-        logger.info("EXTRACT stage logged as STARTED.")
-
-        sourced = extract.run_extract(
-            run_id,
-            pipeline_name,
-            file_path,
-            expected_columns,
-            logger
-        )
-
-        logger.info("EXTRACT completed | rows=%d", len(sourced))
+        with _stage(stage_log, run_id, "EXTRACT", None, logger) as stage_data:
+            sourced = extract.run_extract(
+                run_id,
+                pipeline_name,
+                file_path,
+                expected_columns,
+                column_types,
+                logger
+            )
+            n_sourced = len(sourced)
+            stage_data["rows_in"] = stage_data["rows_out"] = n_sourced
 
-        _update_stage(
-            control_connection,
-            stage_data,
-            "SUCCESS",
-            len(sourced),
-            len(sourced),
-            None
-        )
-        logger.info("EXTRACT stage logged as SUCCESS")
+        if info_enabled:
+            logger.info("EXTRACT completed | rows=%d", n_sourced)
 
         # ------------------------------------------------------------------
         # TRANSFORM CLEAN (T1)
         # ------------------------------------------------------------------
         logger.info("Starting TRANSFORM CLEAN (T1)")
-        stage_data = _insert_stage(
-            control_connection,
-            run_id,
-            "TRANSFORM_P1",
-            "STARTED",
-            len(sourced)
-        )
-        logger.info("TRANSFORM CLEAN (T1) stage logged as STARTED.")
-
-        cleaned = transform_data_cleaning.run_transform_data_cleaning(
-            pipeline_name,
-            sourced,
-            primary_key,
-            column_defaults,
-            column_types,
-            logger
-        )
-
-        logger.info(
-            "TRANSFORM CLEAN (T1) completed | rows_before=%d | rows_after=%d",
-            len(sourced),
-            len(cleaned)
-        )
+        with _stage(stage_log, run_id, "TRANSFORM_P1", n_sourced, logger) as stage_data:
+            cleaned = transform_data_cleaning.run_transform_data_cleaning(
+                pipeline_name,
+                sourced,
+                primary_key,
+                column_defaults,
+                column_types,
+                logger
+            )
+            n_cleaned = len(cleaned)
+            stage_data["rows_out"] = n_cleaned
 
-        _update_stage(
-            control_connection,
-            stage_data,
-            "SUCCESS",
-            len(sourced),
-            len(cleaned),
-            None
-        )
-        logger.info("TRANSFORM CLEAN (T1) stage logged as SUCCESS")
+        if info_enabled:
+            logger.info(
+                "TRANSFORM CLEAN (T1) completed | rows_before=%d | rows_after=%d",
+                n_sourced,
+                n_cleaned
+            )
 
         # ------------------------------------------------------------------
         # TRANSFORM MODEL (T2)
         # ------------------------------------------------------------------
         logger.info("Starting TRANSFORM MODEL (T2)")
-        stage_data = _insert_stage(
-            control_connection,
-            run_id,
-            "TRANSFORM_P2",
-            "STARTED",
-            len(cleaned)
-        )
-        logger.info("TRANSFORM MODEL (T2) stage logged as STARTED.")
+        with _stage(stage_log, run_id, "TRANSFORM_P2", n_cleaned, logger) as stage_data:
+            modeled = transform_data_modeling.run_transform_data_modeling(
+                pipeline_name,
+                cleaned,
+                expected_columns,
+                primary_key,
+                logger,
+                state_region_keys=config.STATE_REGION_KEYS,
+                state_region_values=config.STATE_REGION_VALUES,
+                as_of_date=config.AS_OF_DATE
+            )
+            n_modeled = len(modeled)
+            stage_data["rows_out"] = n_modeled
 
-        modeled = transform_data_modeling.run_transform_data_modeling(
-            pipeline_name,
-            cleaned,
-            expected_columns,
-            primary_key,
-            logger,
-            state_region_map=config.STATE_REGION_MAP,
-            as_of_date=config.AS_OF_DATE
-        )
+        if info_enabled:
+            logger.info(
+                "TRANSFORM MODEL (T2) completed | rows_before=%d | rows_after=%d",
+                n_cleaned,
+                n_modeled
+            )
 
-        logger.info(
-            "TRANSFORM MODEL (T2) completed | rows_before=%d | rows_after=%d",
-            len(cleaned),
-            len(modeled)
+        return modeled
+
+    except Exception as err:
+        logger.error("Pipeline execution failed | pipeline=%s | run_id=%s", pipeline_name, run_id)
+        logger.exception("Failure details")
+        _record_failure(control_connection, run_data, err, logger)
+        raise
+
+    finally:
+        if control_connection:
+            _flush_stage_log(control_connection, stage_log)
+
+
+def _run_load_phase(
+    pipeline_name: str,
+    run_id: str,
+    modeled: pd.DataFrame,
+    batch_size: int = load.LOAD_BATCH_SIZE
+) -> None:
+    """
+    Run the LOAD stage(s) for a pipeline run and finalize the run status.
+
+    :param pipeline_name: Logical pipeline name
+    :param run_id: Pipeline run id (run row created by the transform phase)
+    :param modeled: Modeled (T2) DataFrame
+    :param batch_size: Maximum rows per INSERT statement
+    :return: None
+    """
+    logger = text_logger.get_logger(run_id, pipeline_name)
+    info_enabled = logger.isEnabledFor(logging.INFO)
+    control_connection = None
+    warehouse_connection = None
+    run_data = {"run_id": run_id}
+    stage_log = []
+
+    try:
+        n_modeled = len(modeled)
+        profile = config.PROFILES[pipeline_name]
+        table_name = profile.table_name
+        primary_key = profile.primary_key
+
+        # ------------------------------------------------------------------
+        # Connect to databases
+        # ------------------------------------------------------------------
+        if info_enabled:
+            logger.info("Connecting to control database at path=%s", config.CONTROL_DB_PATH)
+        control_connection = _get_control_connection(
+            config.CONTROL_DB_PATH, logger
         )
+        logger.info("Connected to control database")
 
-        _update_stage(
-            control_connection,
-            stage_data,
-            "SUCCESS",
-            len(cleaned),
-            len(modeled),
-            None
+        if info_enabled:
+            logger.info(
+                "Connecting to warehouse database at path=%s",
+                config.RETAIL_SALES_DB_PATH
+            )
+        warehouse_connection = _get_warehouse_connection(
+            config.RETAIL_SALES_DB_PATH, logger
         )
-        logger.info("TRANSFORM MODEL (T2) stage logged as SUCCESS")
+        logger.info("Connected to warehouse database")
 
         # ------------------------------------------------------------------
         # SALES-SPECIFIC DATE DIM
@@ -251,78 +401,49 @@ def run_pipeline(pipeline_name: str) -> None:
             min_sale_date = modeled["sale_date"].min()
             max_sale_date = modeled["sale_date"].max()
 
-            logger.info(
-                "Date dim range | min_date=%s | max_date=%s",
-                min_sale_date,
-                max_sale_date
-            )
+            if info_enabled:
+                logger.info(
+                    "Date dim range | min_date=%s | max_date=%s",
+                    min_sale_date,
+                    max_sale_date
+                )
 
             date_dim = transform_data_modeling.build_date_dim(
                 min_sale_date,
                 max_sale_date,
                 logger
             )
-
-            logger.info("Date dim built | rows=%d", len(date_dim))
-
-            stage_data = _insert_stage(
-                control_connection,
-                run_id,
-                "LOAD_DATE_DIM",
-                "STARTED",
-                len(date_dim)
-            )
-            logger.info("LOAD stage logged as STARTED.")
-
-
-            load.run_load(
-                date_dim,
-                "date_dim",
-                ["date"],
-                warehouse_connection,
-                logger
-            )
-
-            _update_stage(
-                control_connection,
-                stage_data,
-                "SUCCESS",
-                len(date_dim),
-                len(date_dim),
-                None
-            )
-            logger.info("LOAD_DATE_DIM stage logged as SUCCESS")
+            n_date_dim = len(date_dim)
+
+            if info_enabled:
+                logger.info("Date dim built | rows=%d", n_date_dim)
+
+            with _stage(stage_log, run_id, "LOAD_DATE_DIM", n_date_dim, logger) as stage_data:
+                load.run_load(
+                    date_dim,
+                    "date_dim",
+                    ["date"],
+                    warehouse_connection,
+                    logger,
+                    batch_size=batch_size
+                )
+                stage_data["rows_out"] = n_date_dim
 
         # ------------------------------------------------------------------
         # LOAD
         # ------------------------------------------------------------------
-        logger.info("Starting LOAD stage for table=%s", table_name)
-        stage_data = _insert_stage(
-            control_connection,
-            run_id,
-            "LOAD",
-            "STARTED",
-            len(modeled)
-        )
-        logger.info("LOAD stage logged as STARTED.")
-
-        load.run_load(
-            modeled,
-            table_name,
-            primary_key,
-            warehouse_connection,
-            logger
-        )
-
-        _update_stage(
-            control_connection,
-            stage_data,
-            "SUCCESS",
-            len(modeled),
-            len(modeled),
-            None
-        )
-        logger.info("LOAD stage logged as SUCCESS")
+        if info_enabled:
+            logger.info("Starting LOAD stage for table=%s", table_name)
+        with _stage(stage_log, run_id, "LOAD", n_modeled, logger) as stage_data:
+            load.run_load(
+                modeled,
+                table_name,
+                primary_key,
+                warehouse_connection,
+                logger,
+                batch_size=batch_size
+            )
+            stage_data["rows_out"] = n_modeled
 
         # ------------------------------------------------------------------
         # Finalize run
@@ -334,38 +455,60 @@ def run_pipeline(pipeline_name: str) -> None:
     except Exception as err:
         logger.error("Pipeline execution failed | pipeline=%s | run_id=%s", pipeline_name, run_id)
         logger.exception("Failure details")
-
-        if stage_data:
-            logger.info("Updating failed stage log")
-            _update_stage(
-                control_connection,
-                stage_data,
-                "FAILED",
-                None,
-                None,
-                str(err)
-            )
-
-        if control_connection:
-            logger.info("Updating pipeline run status to FAILED")
-            _update_run(
-                control_connection,
-                run_data,
-                "FAILED",
-                str(err)
-            )
-
+        _record_failure(control_connection, run_data, err, logger)
         raise
 
     finally:
-        logger.info("Closing database connections")
         if control_connection:
-            control_connection.close()
-        if warehouse_connection:
-            warehouse_connection.close()
+            _flush_stage_log(control_connection, stage_log)
         logger.info("Pipeline resources released")
 
 
+@contextmanager
+def _stage(
+    stage_log: List[Dict[str, Any]],
+    run_id: str,
+    stage_name: str,
+    rows_in: int | None,
+    logger: logging.Logger
+) -> Iterator[Dict[str, Any]]:
+    """
+    Record a stage as STARTED, then SUCCESS or FAILED depending on how the block exits.
+
+    The block reports its output by setting stage_data["rows_out"] (and
+    stage_data["rows_in"] when it is only known after the work).
+    """
+    stage_data = _insert_stage(stage_log, run_id, stage_name, "STARTED", rows_in)
+    logger.info("%s stage logged as STARTED.", stage_name)
+
+    try:
+        yield stage_data
+    except Exception as err:
+        logger.info("Updating failed stage log")
+        _update_stage(stage_data, "FAILED", None, None, str(err))
+        raise
+
+    _update_stage(stage_data, "SUCCESS", stage_data["rows_in"], stage_data["rows_out"], None)
+    logger.info("%s stage logged as SUCCESS", stage_name)
+
+
+def _record_failure(
+    control_connection: sqlite3.Connection | None,
+    run_data: Dict[str, Any] | None,
+    err: Exception,
+    logger: logging.Logger
+) -> None:
+    """Mark the pipeline run as FAILED (the failed stage is marked by _stage)."""
+    if control_connection and run_data:
+        logger.info("Updating pipeline run status to FAILED")
+        _update_run(
+            control_connection,
+            run_data,
+            "FAILED",
+            str(err)
+        )
+
+
 # ============================================================================================
 # Internal Helpers
 # ============================================================================================
@@ -375,33 +518,80 @@ def _utc_now() -> str:
 
 
 def _get_run_id() -> str:
-    """Generate a unique run identifier."""
-    return str(uuid.uuid4())
+    """Generate a unique run identifier (128 random bits as 32 hex chars)."""
+    return os.urandom(16).hex()
 
 
 def _get_control_connection(
     db_path: str,
     logger: logging.Logger
 ) -> sqlite3.Connection:
-    """Create and return control DB connection."""
-    conn = sqlite3.connect(db_path)
-    conn.execute("PRAGMA foreign_keys = ON")
-    return conn
+    """Return the process-wide control DB connection."""
+    return _get_cached_connection(db_path)
 
 
 def _get_warehouse_connection(
     db_path: str,
     logger: logging.Logger
 ) -> sqlite3.Connection:
-    """Create and return warehouse DB connection."""
-    conn = sqlite3.connect(db_path)
-    conn.execute("PRAGMA foreign_keys = ON")
+    """Return the process-wide warehouse DB connection."""
+    return _get_cached_connection(db_path)
+
+
+def _get_cached_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Open a SQLite connection once per (db_path, process) and reuse it.
+
+    The pid is part of the key so a forked worker never reuses a handle
+    inherited from its parent. Connections are closed at interpreter exit.
+    """
+    key = (str(db_path), os.getpid())
+    conn = _CONNECTIONS.get(key)
+    if conn is None:
+        # Larger statement cache: load SQL varies by table and chunk shape
+        conn = sqlite3.connect(db_path, cached_statements=256)
+        conn.execute("PRAGMA foreign_keys = ON")
+        # Deleted rows are not overwritten with zeros on each full-table reload
+        conn.execute("PRAGMA secure_delete = OFF")
+        _tune_connection(conn)
+        _CONNECTIONS[key] = conn
     return conn
 
 
+def _close_cached_connections() -> None:
+    """Close every connection opened by this process."""
+    pid = os.getpid()
+    for (_, owner_pid), conn in list(_CONNECTIONS.items()):
+        if owner_pid == pid:
+            conn.close()
+    _CONNECTIONS.clear()
+
+
+atexit.register(_close_cached_connections)
+
+
+def _tune_connection(conn: sqlite3.Connection) -> None:
+    """
+    Apply WAL and cache PRAGMAs to a control or warehouse SQLite connection.
+
+    WAL + synchronous=NORMAL skips the fsync on each commit; after a power
+    loss the most recent commits may be rolled back, but the database file
+    is never corrupted. Loads are idempotent, so a rerun recovers them; a
+    lost control-DB commit only drops log rows for the interrupted run.
+    """
+    for pragma in (
+        "journal_mode = WAL",
+        "synchronous = NORMAL",
+        "temp_store = MEMORY",
+        "cache_size = -65536",
+        "mmap_size = 268435456",
+    ):
+        conn.execute(f"PRAGMA {pragma}")
+
+
 def _is_pipeline_valid(
     pipeline_name: str,
-    valid_pipelines: List[str],
+    valid_pipelines: AbstractSet[str],
     logger: logging.Logger
 ) -> None:
     """Validate pipeline name."""
@@ -410,13 +600,13 @@ def _is_pipeline_valid(
 
 
 def _insert_stage(
-    connection: sqlite3.Connection,
+    stage_log: List[Dict[str, Any]],
     run_id: str,
     stage_name: str,
     status: str,
     rows_in: int | None
 ) -> Dict[str, Any]:
-    """Insert a stage START record."""
+    """Buffer a stage START record (written by _flush_stage_log)."""
     stage_data = {
         "run_id": run_id,
         "stage_name": stage_name,
@@ -427,29 +617,34 @@ def _insert_stage(
         "end_time": None,
         "error_message": None,
     }
-    log_table_helpers.insert_stage(connection, stage_data)
+    stage_log.append(stage_data)
     return stage_data
 
 
 def _update_stage(
-    connection: sqlite3.Connection,
     stage_data: Dict[str, Any],
     status: str,
     rows_in: int | None,
     rows_out: int | None,
     error_message: str | None
 ) -> None:
-    """Update terminal stage status."""
-    stage_data.update(
-        {
-            "status": status,
-            "rows_in": rows_in,
-            "rows_out": rows_out,
-            "end_time": _utc_now(),
-            "error_message": error_message,
-        }
-    )
-    log_table_helpers.update_stage_status(connection, stage_data)
+    """Update terminal stage status on the buffered record."""
+    stage_data["status"] = status
+    stage_data["rows_in"] = rows_in
+    stage_data["rows_out"] = rows_out
+    stage_data["end_time"] = _utc_now()
+    stage_data["error_message"] = error_message
+
+
+def _flush_stage_log(
+    connection: sqlite3.Connection,
+    stage_log: List[Dict[str, Any]]
+) -> None:
+    """Write all buffered stage records in a single transaction and clear the buffer."""
+    if stage_log:
+        with connection:
+            log_table_helpers.insert_stages(connection, stage_log)
+        stage_log.clear()
 
 
 def _insert_run(
@@ -468,7 +663,8 @@ def _insert_run(
         "end_time": None,
         "error_message": None,
     }
-    log_table_helpers.insert_run(connection, run_data)
+    with connection:
+        log_table_helpers.insert_run(connection, run_data)
     return run_data
 
 
@@ -479,21 +675,18 @@ def _update_run(
     error_message: str | None
 ) -> None:
     """Update pipeline run terminal status."""
-    run_data.update(
-        {
-            "status": status,
-            "end_time": _utc_now(),
-            "error_message": error_message,
-        }
-    )
-    log_table_helpers.update_run_status(connection, run_data)
+    run_data["status"] = status
+    run_data["end_time"] = _utc_now()
+    run_data["error_message"] = error_message
+    with connection:
+        log_table_helpers.update_run_status(connection, run_data)
 
 # ============================================================================================
 # CLI input using argparse
 # ============================================================================================
 def _build_parser():
     prog = "retail_sales_etl"
-    usage = "retail_sales_etl --pipeline_name {customers, products, stores, sales} [--dry-run]"
+    usage = "retail_sales_etl --pipeline_name {customers, products, stores, sales, all} [--dry-run]"
     description = ""
     epilog = ""
 
@@ -513,23 +706,21 @@ def _build_user_inputs():
         "--pipeline_name", "-p",
         dest="pipeline_name",
         type=str,
-        choices=["customers", "products", "stores", "sales"],
-        help="Pipeline name"
+        choices=["customers", "products", "stores", "sales", "all"],
+        help="Pipeline name (all = every pipeline, Extract/Transform in parallel)"
     )
 
     parser.add_argument(
         "--dry-run", "-d",
         dest="dry_run",
-        type=bool,
-        default=False,
-        choices=[True, False],
+        action="store_true",
         help="validate config + connectivity only"
     )
 
     return parser
 
 def _parse_user_inputs():
-    parser = _build_user_inputs()
+    parser = _PARSER
 
     try:
         args = parser.parse_args()
@@ -542,6 +733,10 @@ def _parse_user_inputs():
         return user_input
 
 
+# Built once at import; reused by every _parse_user_inputs call
+_PARSER = _build_user_inputs()
+
+
 # ============================================================================================
 # Entry point in code
 # ============================================================================================
@@ -0,0 +1,83 @@
+"""
+------------------------------------------------------------------------------------
+Module Name: init_common
+------------------------------------------------------------------------------------
+This module holds the **shared database initialization routine** used by the
+control and warehouse init scripts.
+
+It is responsible for:
+- Resolving the project-level `db/` and `sql/` directories
+- Creating a SQLite database file (if missing) and switching it to WAL
+- Executing a DDL script against it
+- Refreshing planner statistics before closing
+
+------------------------------------------------------------------------------------
+Design Notes
+------------------------------------------------------------------------------------
+- Foreign key enforcement is explicitly enabled via PRAGMA
+- WAL journaling is persisted in the database file
+- No logging framework is used (bootstrap-safe)
+- Safe to re-run; DDL scripts use IF NOT EXISTS
+------------------------------------------------------------------------------------
+"""
+
+import sqlite3
+from pathlib import Path
+
+# ====================================================================================
+# Find db/ and sql/ directories
+# ====================================================================================
+BASE_DIR = Path(__file__).resolve().parent
+PROJECT_PATH = BASE_DIR.parent
+
+DB_DIR_PATH = PROJECT_PATH / "db"
+DDL_DIR_PATH = PROJECT_PATH / "sql"
+
+if not DB_DIR_PATH.is_dir() or not DDL_DIR_PATH.is_dir():
+    raise FileNotFoundError(f"Either DB or SQL directory not found. {DB_DIR_PATH}, {DDL_DIR_PATH}")
+
+
+# ====================================================================================
+# Connect to db file and execute DDL script
+# ====================================================================================
+def init_db(db_path: Path, ddl_path: Path, db_label: str) -> None:
+    """
+    Create (or update) a SQLite database from a DDL script.
+
+    :param db_path: Path to the SQLite database file
+    :param ddl_path: Path to the DDL script
+    :param db_label: Human-readable database name used in messages
+    :return: None
+    :raises: RuntimeError
+    """
+    connection = None
+    try:
+        if not ddl_path.exists():
+            raise FileNotFoundError(f"DDL script missing at {ddl_path}")
+
+        connection = sqlite3.connect(db_path)
+        connection.execute("PRAGMA foreign_keys = ON")
+
+        # WAL is persisted in the DB file, so every later connection inherits it
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute("PRAGMA wal_autocheckpoint = 1000")
+
+        connection.executescript(ddl_path.read_text(encoding="utf-8"))
+
+        connection.commit()
+
+        # Refresh planner statistics before closing (bounded, no-op on an empty DB)
+        connection.execute("PRAGMA analysis_limit = 1000")
+        connection.execute("PRAGMA optimize")
+        print(f"{db_label} initialized")
+
+    except sqlite3.Error as err:
+        if connection:
+            connection.rollback()
+        raise RuntimeError(f"SQLite error during {db_label} init: {err}")
+    except FileNotFoundError as err:
+        raise RuntimeError(f"DDL file not found: {err}")
+    finally:
+        if connection:
+            connection.close()
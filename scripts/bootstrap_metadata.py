@@ -25,29 +25,94 @@ Design Notes
 ------------------------------------------------------------------------------------
 - This script is intended to be run **once per environment**
 - Safe to re-run if INSERTs are guarded or tables are reset
+- All inserts run in one BEGIN IMMEDIATE ... COMMIT transaction (control_txn)
 - No ETL logic or data processing is performed here
 - Uses explicit metadata definitions (no inference)
 ------------------------------------------------------------------------------------
 """
 
 import sqlite3
+import sys
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
+from typing import Any, Sequence
+
+# Run as a script, so the project root is not on sys.path by default
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.metadata_table_helpers import control_txn
+from utils.sqlite_limits import get_variable_limit
+
+
+# Applied before the bootstrap transaction (journal_mode cannot change inside one)
+_BOOTSTRAP_PRAGMAS = (
+    "journal_mode = WAL",
+    "synchronous = NORMAL",
+    "temp_store = MEMORY",
+)
 
 
 def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _insert_rows(
+    connection: sqlite3.Connection,
+    insert_sql: str,
+    row_placeholder: str,
+    rows: Sequence[Sequence[Any]]
+) -> None:
+    """
+    Insert rows with multi-row VALUES statements instead of one step per row.
+
+    :param connection: Active SQLite connection
+    :param insert_sql: INSERT statement up to (and including) the VALUES keyword
+    :param row_placeholder: Placeholder group for one row, e.g. "(?, ?, ?)"
+    :param rows: Parameter tuples, one per row
+    :return: None
+    """
+    if not rows:
+        return
+
+    chunk_size = max(1, get_variable_limit(connection) // len(rows[0]))
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        connection.execute(
+            insert_sql + " " + ", ".join([row_placeholder] * len(chunk)),
+            list(chain.from_iterable(chunk))
+        )
+
+
 def bootstrap_metadata(connection: sqlite3.Connection) -> None:
     """
     Insert static metadata records for pipelines and warehouse tables.
 
+    All three inserts are committed together; any failure rolls back the
+    whole bootstrap.
+
     :param connection: Active SQLite connection to control database
     :return: None
     """
     now = _utc_now()
 
+    for pragma in _BOOTSTRAP_PRAGMAS:
+        connection.execute(f"PRAGMA {pragma}")
+
+    with control_txn(connection):
+        _insert_metadata(connection, now)
+
+
+def _insert_metadata(connection: sqlite3.Connection, now: str) -> None:
+    """
+    Insert pipeline, table and pipeline-to-table metadata rows.
+
+    :param connection: Active SQLite connection inside an open transaction
+    :param now: Timestamp used for created_at / updated_at
+    :return: None
+    """
     # ------------------------------------------------------------------
     # Pipeline metadata
     # ------------------------------------------------------------------
@@ -58,12 +123,14 @@ def bootstrap_metadata(connection: sqlite3.Connection) -> None:
         ("sales", "sales", "full", "manual", 1),
     ]
 
-    connection.executemany(
+    _insert_rows(
+        connection,
         """
         INSERT INTO pipeline_md
         (pipeline_name, source_name, load_strategy, schedule, is_active, created_at, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
+        VALUES
         """,
+        "(?, ?, ?, ?, ?, ?, ?)",
         [(p, s, ls, sch, ia, now, now) for p, s, ls, sch, ia in pipelines]
     )
 
@@ -78,7 +145,8 @@ def bootstrap_metadata(connection: sqlite3.Connection) -> None:
         ("date_dim", "load", "sales", "date", "date", "full", None),
     ]
 
-    connection.executemany(
+    _insert_rows(
+        connection,
         """
         INSERT INTO table_md
         (
@@ -95,8 +163,9 @@ def bootstrap_metadata(connection: sqlite3.Connection) -> None:
             created_at,
             updated_at
         )
-        VALUES (?, ?, ?, ?, ?, ?, ?, NULL, 0, 1, ?, ?)
+        VALUES
         """,
+        "(?, ?, ?, ?, ?, ?, ?, NULL, 0, 1, ?, ?)",
         [(t, l, s, g, pk, ls, wm, now, now) for t, l, s, g, pk, ls, wm in tables]
     )
 
@@ -111,25 +180,23 @@ def bootstrap_metadata(connection: sqlite3.Connection) -> None:
         ("sales", "sales_fact", 2, "fact"),
     ]
 
-    connection.executemany(
+    _insert_rows(
+        connection,
         """
         INSERT INTO pipeline_table_map
         (pipeline_name, table_name, load_order, table_role)
-        VALUES (?, ?, ?, ?)
+        VALUES
         """,
+        "(?, ?, ?, ?)",
         pipeline_table_maps
     )
 
-    connection.commit()
-
 
 if __name__ == "__main__":
-    BASE_DIR = Path(__file__).resolve().parent
-    PROJECT_ROOT = BASE_DIR.parent
-
     CONTROL_DB_PATH = PROJECT_ROOT / "db" / "etl_control.db"
 
-    conn = sqlite3.connect(CONTROL_DB_PATH)
+    # Autocommit mode: bootstrap_metadata manages its own transaction
+    conn = sqlite3.connect(CONTROL_DB_PATH, isolation_level=None)
     conn.execute("PRAGMA foreign_keys = ON")
 
     try:
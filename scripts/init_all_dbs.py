@@ -0,0 +1,24 @@
+"""
+------------------------------------------------------------------------------------
+Module Name: init_all_dbs
+------------------------------------------------------------------------------------
+This script initializes **both** SQLite databases of the Retail Sales ETL system
+in a single process: the ETL control database and the warehouse database.
+
+------------------------------------------------------------------------------------
+Design Notes
+------------------------------------------------------------------------------------
+- Equivalent to running init_control_db and init_retail_sales_db in turn
+- Pays interpreter start-up and sqlite3 import once for both databases
+- Safe to re-run
+------------------------------------------------------------------------------------
+"""
+
+from _init_common import init_db
+import init_control_db
+import init_retail_sales_db
+
+
+if __name__ == "__main__":
+    init_db(init_control_db.DB_PATH, init_control_db.DDL_PATH, "Control DB")
+    init_db(init_retail_sales_db.DB_PATH, init_retail_sales_db.DDL_PATH, "Warehouse DB")
@@ -27,72 +27,25 @@ Design Notes
 ------------------------------------------------------------------------------------
 - Uses SQLite as a lightweight control-plane database
 - Foreign key enforcement is explicitly enabled via PRAGMA
+- The database file is switched to WAL journaling (persistent)
 - No logging framework is used (bootstrap-safe)
 - No ETL logic, data processing, or runtime orchestration exists here
 - This module performs schema initialization only
+- Connect / PRAGMA / DDL steps are shared via _init_common.init_db
 ------------------------------------------------------------------------------------
 """
 
-import sqlite3
-from pathlib import Path
+from _init_common import DB_DIR_PATH, DDL_DIR_PATH, init_db
 
 # ====================================================================================
-# Find db/ and sql/ directories
+# Build db and ddl paths
 # ====================================================================================
-
-BASE_DIR = Path(__file__).resolve().parent
-PROJECT_PATH = BASE_DIR.parent
-
 DB_FILE_NAME = "etl_control.db"
 DDL_SCRIPT_NAME = "create_control_tables.sql"
 
-DB_DIR_PATH = None
-DDL_DIR_PATH = None
-for path in PROJECT_PATH.iterdir():
-    if path.name == "db":
-        DB_DIR_PATH = path
-    if path.name == "sql":
-        DDL_DIR_PATH = path
-
-# ====================================================================================
-# Build db and ddl paths
-# ====================================================================================
-if DB_DIR_PATH is None or DDL_DIR_PATH is None:
-    raise FileNotFoundError(f"Either DB or SQL directory not found. {DB_DIR_PATH}, {DDL_DIR_PATH}")
-
 DB_PATH = DB_DIR_PATH / DB_FILE_NAME
 DDL_PATH = DDL_DIR_PATH / DDL_SCRIPT_NAME
 
-# ====================================================================================
-# Ensure db folder exists
-# ====================================================================================
-DB_PATH.parent.mkdir(exist_ok=True)
-
-# ====================================================================================
-# Connect to db file and execute DDL script
-# ====================================================================================
-connection = None
-try:
-    if not DDL_PATH.exists():
-        raise FileNotFoundError(f"DDL script missing at {DDL_PATH}")
-
-    connection = sqlite3.connect(DB_PATH)
-    connection.execute("PRAGMA foreign_keys = ON")
-
-    with open(DDL_PATH) as ddl_file:
-        connection.executescript(ddl_file.read())
-
-    connection.commit()
-    print("Control DB initialized")
-
-except sqlite3.Error as err:
-    if connection:
-        connection.rollback()
-    raise RuntimeError(f"SQLite error during control DB init: {err}")
-except FileNotFoundError as err:
-    raise RuntimeError(f"DDL file not found: {err}")
-finally:
-    if connection:
-        connection.close()
-
 
+if __name__ == "__main__":
+    init_db(DB_PATH, DDL_PATH, "Control DB")
@@ -151,5 +151,10 @@ CREATE TABLE IF NOT EXISTS pipeline_table_map (
     FOREIGN KEY (pipeline_name) REFERENCES pipeline_md(pipeline_name),
     FOREIGN KEY (table_name) REFERENCES table_md(table_name)
 );
-
-
+-- =================================================================================
+-- Indexes
+--     ix_ptm_pipeline_load_order	Ordered table lookup per pipeline (no sort step)
+--     etl_stage_log(run_id) and table_md(table_name) are covered by their PKs
+-- =================================================================================
+CREATE INDEX IF NOT EXISTS ix_ptm_pipeline_load_order
+    ON pipeline_table_map (pipeline_name, load_order);
@@ -0,0 +1,44 @@
+import sqlite3
+from pathlib import Path
+
+from utils import log_table_helpers, metadata_table_helpers
+
+_CONTROL_DDL = Path(__file__).resolve().parent.parent / "sql" / "create_control_tables.sql"
+
+
+def _control_connection(row_factory=None):
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(_CONTROL_DDL.read_text())
+    if row_factory is not None:
+        connection.row_factory = row_factory
+    return connection
+
+
+def _check_single_row_getters(connection):
+    log_table_helpers.insert_run(connection, {
+        "run_id": "r1",
+        "pipeline_name": "customers",
+        "source_name": "customers",
+        "status": "STARTED",
+        "start_time": "2025-01-01T00:00:00+00:00",
+    })
+    metadata_table_helpers.register_pipeline(connection, {
+        "pipeline_name": "customers",
+        "source_name": "customers",
+        "load_strategy": "full",
+        "schedule": "manual",
+        "is_active": 1,
+    })
+
+    assert log_table_helpers.get_run(connection, "r1")["status"] == "STARTED"
+    assert log_table_helpers.get_run(connection, "missing") is None
+    assert metadata_table_helpers.get_pipeline(connection, "customers")["is_active"] == 1
+    assert metadata_table_helpers.get_table(connection, "missing") is None
+
+
+def test_single_row_getters_with_default_tuple_rows():
+    _check_single_row_getters(_control_connection())
+
+
+def test_single_row_getters_with_sqlite_row():
+    _check_single_row_getters(_control_connection(sqlite3.Row))
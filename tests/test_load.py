@@ -0,0 +1,28 @@
+import logging
+import sqlite3
+
+import pytest
+
+from etl import load
+
+
+def _connection(rows):
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE t (pk1, pk2)")
+    connection.executemany("INSERT INTO t VALUES (?, ?)", rows)
+    return connection
+
+
+def _validate(connection, row_count):
+    load._validate_data_integrity(
+        "t", ["pk1", "pk2"], row_count, connection, logging.getLogger("test")
+    )
+
+
+def test_composite_key_parts_containing_the_separator_are_not_duplicates():
+    _validate(_connection([("a|b", "c"), ("a", "b|c"), (1, "x"), ("1", "x")]), 4)
+
+
+def test_duplicate_composite_key_is_detected():
+    with pytest.raises(ValueError, match="Duplicate primary keys"):
+        _validate(_connection([("a", "b"), ("a", "b")]), 2)
@@ -0,0 +1,19 @@
+import logging
+
+import pandas as pd
+
+from etl import transform_data_cleaning
+
+
+def test_null_primary_key_rows_are_dropped_by_position():
+    data = pd.DataFrame(
+        {"customer_id": ["C1", None, "C3"], "city": ["PUNE", "PUNE", None]},
+        index=[0, 0, 1]
+    )
+
+    transform_data_cleaning._handle_missing_values(
+        data, ["customer_id"], {"city": "UNKNOWN"}, logging.getLogger("test")
+    )
+
+    assert data["customer_id"].tolist() == ["C1", "C3"]
+    assert data["city"].tolist() == ["PUNE", "UNKNOWN"]
@@ -0,0 +1,39 @@
+import logging
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from etl import transform_data_modeling
+from runner import pipeline_config as config
+
+
+def _build_customers(emails):
+    expected_columns = config.EXPECTED_COLUMNS["customers_dim"]
+    data = pd.DataFrame({
+        "customer_id": [f"C{i}" for i in range(len(emails))],
+        "first_name": "Asha",
+        "last_name": "Rao",
+        "email": pd.Series(emails, dtype="string"),
+        "city": "PUNE",
+        "signup_date": pd.Timestamp("2024-01-01", tz="UTC"),
+    })
+    customers, _ = transform_data_modeling._build_customers_dim(
+        "customers",
+        data,
+        expected_columns,
+        logger=logging.getLogger("test"),
+        as_of_date=datetime(2025, 1, 1, tzinfo=timezone.utc)
+    )
+    return customers["email_domain"]
+
+
+def test_email_domain_is_text_after_first_at():
+    domains = _build_customers(["asha@example.com", "a@b@c", "@x.org"])
+
+    assert domains.tolist() == ["example.com", "b", "x.org"]
+
+
+def test_email_domain_is_null_without_at_or_for_empty_email():
+    domains = _build_customers(["noatsign", ""])
+
+    assert domains.isna().all()
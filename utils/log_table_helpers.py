@@ -22,7 +22,8 @@ Log Tables:
 Design Notes
 ------------------------------------------------------------------------------------
 - Designed for SQLite-based control DB
-- No commits or rollbacks are performed here
+- No commits or rollbacks are performed here; callers own the transaction
+  boundary (e.g. ``with connection:``) so several writes share one commit
 - All timestamps are generated in UTC (ISO-8601)
 - Errors are allowed to propagate to the caller
 - This module does NOT perform logging itself
@@ -32,6 +33,79 @@ Design Notes
 from typing import Any, Dict, List
 from datetime import datetime, timezone
 
+from utils.sqlite_rows import row_as_dict, rows_as_dicts
+
+
+# ------------------------------------------------------------------
+# SQL statements
+# ------------------------------------------------------------------
+_INSERT_RUN_SQL = """
+    INSERT INTO etl_run_log (
+        run_id,
+        pipeline_name,
+        source_name,
+        status,
+        start_time,
+        created_at,
+        updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_RUN_SQL = """
+    UPDATE etl_run_log
+    SET
+        status = ?,
+        end_time = ?,
+        error_message = ?,
+        updated_at = ?
+    WHERE run_id = ?
+"""
+
+_SELECT_RUN_SQL = "SELECT * FROM etl_run_log WHERE run_id = ?"
+
+_INSERT_STAGE_SQL = """
+    INSERT INTO etl_stage_log (
+        run_id,
+        stage_name,
+        status,
+        rows_in,
+        start_time,
+        created_at,
+        updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_STAGES_SQL = """
+    INSERT INTO etl_stage_log (
+        run_id,
+        stage_name,
+        status,
+        rows_in,
+        rows_out,
+        start_time,
+        end_time,
+        error_message,
+        created_at,
+        updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_STAGE_SQL = """
+    UPDATE etl_stage_log
+    SET
+        status = ?,
+        rows_out = ?,
+        end_time = ?,
+        error_message = ?,
+        updated_at = ?
+    WHERE run_id = ? AND stage_name = ?
+"""
+
+_SELECT_STAGES_SQL = "SELECT * FROM etl_stage_log WHERE run_id = ?"
+
 
 # ------------------------------------------------------------------
 # Internal utilities
@@ -56,30 +130,19 @@ def insert_run(connection, run_data: Dict[str, Any]) -> None:
     :param run_data: Dictionary containing run metadata
     :return: None
     """
-    sql_query = """
-        INSERT INTO etl_run_log (
-            run_id,
-            pipeline_name,
-            source_name,
-            status,
-            start_time,
-            created_at,
-            updated_at
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    """
+    sql_query = _INSERT_RUN_SQL
+    logged_at = _utc_now()
     query_params = (
         run_data["run_id"],
         run_data["pipeline_name"],
         run_data["source_name"],
         run_data["status"],
         run_data["start_time"],
-        _utc_now(),
-        _utc_now()
+        logged_at,
+        logged_at
     )
 
     connection.execute(sql_query, query_params)
-    connection.commit()
 
 
 def update_run_status(connection, run_data: Dict[str, Any]) -> None:
@@ -90,15 +153,7 @@ def update_run_status(connection, run_data: Dict[str, Any]) -> None:
     :param run_data: Dictionary containing updated run fields
     :return: None
     """
-    sql_query = """
-        UPDATE etl_run_log
-        SET
-            status = ?,
-            end_time = ?,
-            error_message = ?,
-            updated_at = ?
-        WHERE run_id = ?
-    """
+    sql_query = _UPDATE_RUN_SQL
     query_params = (
         run_data["status"],
         run_data.get("end_time"),
@@ -108,7 +163,6 @@ def update_run_status(connection, run_data: Dict[str, Any]) -> None:
     )
 
     connection.execute(sql_query, query_params)
-    connection.commit()
 
 
 def get_run(connection, run_id: str) -> Dict[str, Any] | None:
@@ -119,12 +173,11 @@ def get_run(connection, run_id: str) -> Dict[str, Any] | None:
     :param run_id: Unique identifier of the ETL run
     :return: Run record as dict, or None if not found
     """
-    sql_query = "SELECT * FROM etl_run_log WHERE run_id = ?"
+    sql_query = _SELECT_RUN_SQL
     query_params = (run_id,)
     cursor = connection.execute(sql_query, query_params)
 
-    run_row = cursor.fetchone()
-    return dict(run_row) if run_row else None
+    return row_as_dict(cursor)
 
 
 # ------------------------------------------------------------------
@@ -138,30 +191,48 @@ def insert_stage(connection, stage_data: Dict[str, Any]) -> None:
     :param stage_data: Dictionary containing stage metadata
     :return: None
     """
-    sql_query = """
-        INSERT INTO etl_stage_log (
-            run_id,
-            stage_name,
-            status,
-            rows_in,
-            start_time,
-            created_at,
-            updated_at
-        )
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    """
+    sql_query = _INSERT_STAGE_SQL
+    logged_at = _utc_now()
     query_params = (
         stage_data["run_id"],
         stage_data["stage_name"],
         stage_data["status"],
         stage_data["rows_in"],
         stage_data["start_time"],
-        _utc_now(),
-        _utc_now()
+        logged_at,
+        logged_at
     )
 
     connection.execute(sql_query, query_params)
-    connection.commit()
+
+
+def insert_stages(connection, stages: List[Dict[str, Any]]) -> None:
+    """
+    Insert complete ETL stage records into etl_stage_log with one executemany.
+
+    :param connection: Active SQLite connection
+    :param stages: List of dictionaries containing full stage metadata
+    :return: None
+    """
+    sql_query = _INSERT_STAGES_SQL
+    logged_at = _utc_now()
+    query_params = [
+        (
+            stage_data["run_id"],
+            stage_data["stage_name"],
+            stage_data["status"],
+            stage_data["rows_in"],
+            stage_data.get("rows_out"),
+            stage_data["start_time"],
+            stage_data.get("end_time"),
+            stage_data.get("error_message"),
+            logged_at,
+            logged_at
+        )
+        for stage_data in stages
+    ]
+
+    connection.executemany(sql_query, query_params)
 
 
 def update_stage_status(connection, stage_data: Dict[str, Any]) -> None:
@@ -172,16 +243,7 @@ def update_stage_status(connection, stage_data: Dict[str, Any]) -> None:
     :param stage_data: Dictionary containing updated stage fields
     :return: None
     """
-    sql_query = """
-        UPDATE etl_stage_log
-        SET
-            status = ?,
-            rows_out = ?,
-            end_time = ?,
-            error_message = ?,
-            updated_at = ?
-        WHERE run_id = ? AND stage_name = ?
-    """
+    sql_query = _UPDATE_STAGE_SQL
     query_params = (
         stage_data["status"],
         stage_data.get("rows_out"),
@@ -193,7 +255,6 @@ def update_stage_status(connection, stage_data: Dict[str, Any]) -> None:
     )
 
     connection.execute(sql_query, query_params)
-    connection.commit()
 
 
 def list_stages_for_run(connection, run_id: str) -> List[Dict[str, Any]]:
@@ -204,9 +265,7 @@ def list_stages_for_run(connection, run_id: str) -> List[Dict[str, Any]]:
     :param run_id: Unique identifier of the ETL run
     :return: List of stage records as dictionaries
     """
-    sql_query = "SELECT * FROM etl_stage_log WHERE run_id = ?"
+    sql_query = _SELECT_STAGES_SQL
     query_params = (run_id,)
     cursor = connection.execute(sql_query, query_params)
-
-    rows = cursor.fetchall()
-    return [dict(row) for row in rows]
+    return rows_as_dicts(cursor)
@@ -27,17 +27,118 @@ Design Notes
 - This module contains **no implementation logic**
 - Function signatures define the expected API surface
 - All helpers are expected to be thin DB accessors
-- Transaction control is handled by callers
+- Transaction control is handled by callers (control_txn groups several
+  helper calls into one BEGIN IMMEDIATE ... COMMIT)
 - Timestamps are expected to be UTC (ISO-8601)
 ------------------------------------------------------------------------------------
 """
 
-from typing import Any, Dict, List
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
 from datetime import datetime, timezone
 
+from utils.sqlite_limits import get_variable_limit
+from utils.sqlite_rows import row_as_dict, rows_as_dicts
+
+
+# ------------------------------------------------------------------
+# SQL statements
+# ------------------------------------------------------------------
+_SELECT_PIPELINE_SQL = "SELECT * FROM pipeline_md WHERE pipeline_name = ?"
+
+_SELECT_ACTIVE_PIPELINES_SQL = "SELECT * FROM pipeline_md WHERE is_active = 1"
+
+_INSERT_PIPELINE_SQL = """
+    INSERT INTO pipeline_md
+    (
+        pipeline_name,
+        source_name,
+        load_strategy,
+        schedule,
+        is_active,
+        created_at,
+        updated_at
+    )
+    VALUES(?, ?, ?, ?, ?, ?, ?)
+"""
+
+_DEACTIVATE_PIPELINE_SQL = """
+    UPDATE pipeline_md
+    SET 
+        is_active = 0,
+        updated_at = ?
+    WHERE pipeline_name = ?
+"""
+
+# IN (...) placeholders are appended per batch, kept under SQLite's parameter limit
+_DEACTIVATE_PIPELINES_SQL = """
+    UPDATE pipeline_md
+    SET
+        is_active = 0,
+        updated_at = ?
+    WHERE pipeline_name IN
+"""
+
+_SELECT_TABLE_SQL = "SELECT * FROM table_md WHERE table_name = ?"
+
+_SELECT_ACTIVE_TABLES_SQL = """
+    SELECT * 
+    FROM table_md 
+    WHERE source_name = ? AND is_active = 1
+"""
+
+_UPDATE_TABLE_WATERMARK_SQL = """
+    UPDATE table_md
+    SET 
+        last_loaded_value = ?,
+        row_count = ?,
+        updated_at = ?
+    WHERE table_name = ?
+"""
+
+_SELECT_PIPELINE_TABLES_SQL = """
+    SELECT tm.*, ptm.load_order, ptm.table_role
+    FROM pipeline_table_map ptm
+             JOIN table_md tm
+                  ON ptm.table_name = tm.table_name
+    WHERE ptm.pipeline_name = ?
+      AND tm.is_active = 1
+    ORDER BY ptm.load_order
+"""
+
+
 def _utc_now():
     return datetime.now(timezone.utc).isoformat()
 
+
+# ------------------------------------------------------------------
+# Transaction helper
+# ------------------------------------------------------------------
+@contextmanager
+def control_txn(connection) -> Iterator[None]:
+    """
+    Run the enclosed helper calls in a single write transaction.
+
+    Example:
+        with control_txn(connection):
+            register_pipeline(connection, pipeline_data)
+            update_table_watermark(connection, table_data)
+
+    :param connection: Active database connection with no open transaction
+    :return: Context manager; commits on success, rolls back on error
+    """
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        # SQLite may already have rolled back (e.g. SQLITE_FULL, interrupt);
+        # a second ROLLBACK would raise and hide the original error
+        if connection.in_transaction:
+            connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
 # ------------------------------------------------------------------
 # Pipeline metadata helpers
 # ------------------------------------------------------------------
@@ -49,12 +150,11 @@ def get_pipeline(connection, pipeline_name: str) -> Dict[str, Any] | None:
     :param pipeline_name: Unique pipeline identifier
     :return: Pipeline metadata record or None if not found
     """
-    sql_query = "SELECT * FROM pipeline_md WHERE pipeline_name = ?"
+    sql_query = _SELECT_PIPELINE_SQL
     query_params = (pipeline_name, )
 
     cursor = connection.execute(sql_query, query_params)
-    pipeline_row = cursor.fetchone()
-    return dict(pipeline_row) if pipeline_row else None
+    return row_as_dict(cursor)
 
 
 def list_active_pipelines(connection) -> List[Dict[str, Any]]:
@@ -64,10 +164,9 @@ def list_active_pipelines(connection) -> List[Dict[str, Any]]:
     :param connection: Active database connection
     :return: List of active pipeline metadata records
     """
-    sql_query = "SELECT * FROM pipeline_md WHERE is_active = 1"
+    sql_query = _SELECT_ACTIVE_PIPELINES_SQL
     cursor = connection.execute(sql_query)
-    active_pipelines = [dict(row) for row in cursor.fetchall()]
-    return active_pipelines
+    return rows_as_dicts(cursor)
 
 
 def register_pipeline(connection, pipeline_data: Dict[str, Any]) -> None:
@@ -78,27 +177,16 @@ def register_pipeline(connection, pipeline_data: Dict[str, Any]) -> None:
     :param pipeline_data: Dictionary containing pipeline metadata
     :return: None
     """
-    sql_query = """
-        INSERT INTO pipeline_md
-        (
-            pipeline_name,
-            source_name,
-            load_strategy,
-            schedule,
-            is_active,
-            created_at,
-            updated_at
-        )
-        VALUES(?, ?, ?, ?, ?, ?, ?)
-    """
+    sql_query = _INSERT_PIPELINE_SQL
+    registered_at = _utc_now()
     query_params = (
         pipeline_data["pipeline_name"],
         pipeline_data["source_name"],
         pipeline_data["load_strategy"],
         pipeline_data["schedule"],
         pipeline_data.get("is_active", 1),
-        _utc_now(),
-        _utc_now()
+        registered_at,
+        registered_at
     )
 
     connection.execute(sql_query, query_params)
@@ -112,13 +200,7 @@ def deactivate_pipeline(connection, pipeline_name: str) -> None:
     :param pipeline_name: Unique pipeline identifier
     :return: None
     """
-    sql_query = """
-        UPDATE pipeline_md
-        SET 
-            is_active = 0,
-            updated_at = ?
-        WHERE pipeline_name = ?
-    """
+    sql_query = _DEACTIVATE_PIPELINE_SQL
     query_params = (
         _utc_now(),
         pipeline_name
@@ -126,6 +208,26 @@ def deactivate_pipeline(connection, pipeline_name: str) -> None:
 
     connection.execute(sql_query, query_params)
 
+
+def deactivate_pipelines(connection, pipeline_names: List[str]) -> None:
+    """
+    Deactivate several pipelines with one UPDATE per batch of names.
+
+    :param connection: Active database connection
+    :param pipeline_names: Unique pipeline identifiers
+    :return: None
+    """
+    deactivated_at = _utc_now()
+    # One parameter is taken by updated_at
+    batch_size = get_variable_limit(connection) - 1
+
+    for start in range(0, len(pipeline_names), batch_size):
+        batch = pipeline_names[start:start + batch_size]
+        sql_query = _DEACTIVATE_PIPELINES_SQL + "(" + ", ".join(["?"] * len(batch)) + ")"
+        query_params = (deactivated_at, *batch)
+
+        connection.execute(sql_query, query_params)
+
 # ------------------------------------------------------------------
 # Table metadata helpers
 # ------------------------------------------------------------------
@@ -137,12 +239,11 @@ def get_table(connection, table_name: str) -> Dict[str, Any] | None:
     :param table_name: Target table name
     :return: Table metadata record or None if not found
     """
-    sql_query = "SELECT * FROM table_md WHERE table_name = ?"
+    sql_query = _SELECT_TABLE_SQL
     query_params = (table_name, )
 
     cursor = connection.execute(sql_query, query_params)
-    table_row = cursor.fetchone()
-    return dict(table_row) if table_row else None
+    return row_as_dict(cursor)
 
 
 def list_active_tables_for_source(connection, source_name: str) -> List[Dict[str, Any]]:
@@ -153,15 +254,10 @@ def list_active_tables_for_source(connection, source_name: str) -> List[Dict[str
     :param source_name: Source system or entity name
     :return: List of active table metadata records
     """
-    sql_query = """
-        SELECT * 
-        FROM table_md 
-        WHERE source_name = ? AND is_active = 1
-    """
+    sql_query = _SELECT_ACTIVE_TABLES_SQL
     query_params = (source_name, )
     cursor = connection.execute(sql_query, query_params)
-    table_rows = [dict(row) for row in cursor.fetchall()]
-    return table_rows
+    return rows_as_dicts(cursor)
 
 
 def update_table_watermark(connection, table_data: Dict[str, Any]) -> None:
@@ -172,14 +268,7 @@ def update_table_watermark(connection, table_data: Dict[str, Any]) -> None:
     :param table_data: Target table data
     :return: None
     """
-    sql_query = """
-        UPDATE table_md
-        SET 
-            last_loaded_value = ?,
-            row_count = ?,
-            updated_at = ?
-        WHERE table_name = ?
-    """
+    sql_query = _UPDATE_TABLE_WATERMARK_SQL
     query_params = (
         table_data["last_loaded_value"],
         table_data["row_count"],
@@ -199,16 +288,7 @@ def list_tables_for_pipeline(connection, pipeline_name: str) -> List[Dict[str, A
     :param pipeline_name: Unique pipeline identifier
     :return: Ordered list of table metadata records for the pipeline
     """
-    sql_query = """
-        SELECT tm.*, ptm.load_order, ptm.table_role
-        FROM pipeline_table_map ptm
-                 JOIN table_md tm
-                      ON ptm.table_name = tm.table_name
-        WHERE ptm.pipeline_name = ?
-          AND tm.is_active = 1
-        ORDER BY ptm.load_order
-    """
+    sql_query = _SELECT_PIPELINE_TABLES_SQL
     query_param = (pipeline_name, )
     cursor = connection.execute(sql_query, query_param)
-    rows = [dict(row) for row in cursor.fetchall()]
-    return rows
+    return rows_as_dicts(cursor)
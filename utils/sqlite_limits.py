@@ -0,0 +1,35 @@
+"""
+------------------------------------------------------------------------------------
+Module Name: sqlite_limits
+------------------------------------------------------------------------------------
+This module holds the **SQLite bound-parameter limit** shared by every writer
+that packs many values into one statement (multi-row INSERT, IN lists).
+
+------------------------------------------------------------------------------------
+Design Notes
+------------------------------------------------------------------------------------
+- Defined once here; loaders, metadata helpers and scripts import it
+- The limit is read from the linked SQLite library when Python exposes it
+------------------------------------------------------------------------------------
+"""
+
+import sqlite3
+
+# SQLite's default bound-parameter limit on older builds (SQLITE_MAX_VARIABLE_NUMBER)
+SQLITE_MAX_VARIABLES = 999
+
+
+def get_variable_limit(connection: sqlite3.Connection) -> int:
+    """
+    Return the bound-parameter limit of the linked SQLite library.
+
+    Builds since SQLite 3.32 allow 32766 parameters; Connection.getlimit
+    (Python 3.11+) reports the actual value, older Pythons use the safe default.
+
+    :param connection: Active SQLite connection
+    :return: Maximum number of parameters per statement
+    """
+    try:
+        return connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    except AttributeError:
+        return SQLITE_MAX_VARIABLES
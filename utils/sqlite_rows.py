@@ -0,0 +1,43 @@
+"""
+------------------------------------------------------------------------------------
+Module Name: sqlite_rows
+------------------------------------------------------------------------------------
+This module converts **SQLite result rows into dictionaries** for the control
+DB helpers (log_table_helpers, metadata_table_helpers).
+
+------------------------------------------------------------------------------------
+Design Notes
+------------------------------------------------------------------------------------
+- Column names come from cursor.description, so rows convert the same way
+  under the default tuple row factory and under sqlite3.Row
+- Column names are read once per cursor rather than per row
+------------------------------------------------------------------------------------
+"""
+
+from typing import Any, Dict, List
+
+
+def rows_as_dicts(cursor) -> List[Dict[str, Any]]:
+    """
+    Build one dict per remaining result row of an executed cursor.
+
+    :param cursor: Executed cursor
+    :return: List of records as dictionaries
+    """
+    column_names = [column[0] for column in cursor.description]
+    return [dict(zip(column_names, row)) for row in cursor]
+
+
+def row_as_dict(cursor) -> Dict[str, Any] | None:
+    """
+    Fetch the next result row of an executed cursor as a dict.
+
+    :param cursor: Executed cursor
+    :return: Record as dictionary, or None if there is no row
+    """
+    row = cursor.fetchone()
+    if row is None:
+        return None
+
+    column_names = [column[0] for column in cursor.description]
+    return dict(zip(column_names, row))
@@ -1,7 +1,16 @@
+import collections
+import contextvars
 import logging
-from logging.handlers import RotatingFileHandler
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from multiprocessing import util as mp_util
 from pathlib import Path
-from datetime import datetime, timezone
+from typing import Iterator
 
 # ================================================================================
 # Log directory & file
@@ -11,15 +20,47 @@ LOG_DIR = BASE_DIR / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 LOG_FILE = LOG_DIR / "etl_logs.log"
 
+# Write buffer for the log file; flushed whenever the listener queue drains
+_LOG_BUFFER_SIZE = 1 << 20
+
+# ETL_LOG_MODE=memory keeps the last records in RAM and writes them to LOG_FILE
+# once at process exit (keeps file I/O out of benchmark runs)
+LOG_MODE = os.environ.get("ETL_LOG_MODE", "file")
+_RING_BUFFER_RECORDS = 100_000
+
 # ================================================================================
 # Logger Configuration
 # ================================================================================
 LOGGER_NAME = "etl_logger"
 
-def _utc_time(*args):
-    return datetime.now(timezone.utc).timetuple()
+# Line layout; _EtlFormatter.formatMessage renders exactly this format
+_LOG_FORMAT = "%(asctime)s | %(levelname)s | %(module)s | %(pipeline_name)s | %(run_id)s | %(message)s"
+
+# Background listener that owns the file handler, and the pid whose handlers
+# are set up (a pool worker has no listener, see init_worker)
+_LISTENER = None
+_LISTENER_PID = None
+
+# Serializes handler setup between threads of one process
+_INIT_LOCK = threading.Lock()
+
+# Run context stamped on every record by _ContextFilter (set by get_logger)
+_RUN_ID = contextvars.ContextVar("run_id", default="-")
+_PIPELINE_NAME = contextvars.ContextVar("pipeline_name", default="-")
+
+# asctime in UTC, converted from each record's own creation time
+logging.Formatter.converter = time.gmtime
+
+# The format string uses none of these, so skip gathering them per LogRecord.
+# Caller-frame lookup (_srcfile) stays on: %(module)s is derived from it.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False  # Python 3.12+; ignored by older versions
+
+# Hot-loop callers should guard messages whose arguments are costly to build
+# with logger.isEnabledFor(level) before calling logger.debug/info
 
-logging.Formatter.converter = _utc_time
 
 def get_logger(
         run_id: str,
@@ -39,33 +80,289 @@ def get_logger(
     # we need to safeguard that same logger is used
     # -----------------------------------------------------------------------------
 
-    if not logger.handlers:
-        # -----------------------------------------------------------------------------
-        # Create handler
-        # -----------------------------------------------------------------------------
-        handler = RotatingFileHandler(
-            filename = LOG_FILE,
-            maxBytes = 5 * 1024 * 1024, # 5MB log
-            backupCount = 3 # 3 backups to be kept before rotating logs
+    # -----------------------------------------------------------------------------
+    # Handlers inherited across a fork point at the parent's listener thread,
+    # which does not exist in the child, so each process builds its own
+    # (pool workers are set up by init_worker instead)
+    # -----------------------------------------------------------------------------
+    _ensure_handlers(logger)
+
+    # -----------------------------------------------------------------------------
+    # Bind run context; the filter copies it onto each record, so the plain
+    # logger is returned (no LoggerAdapter dispatch per call)
+    # -----------------------------------------------------------------------------
+    _RUN_ID.set(run_id)
+    _PIPELINE_NAME.set(pipeline_name)
+
+    return logger
+
+
+class _FastRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that formats each record once, tracks the file size
+    itself and writes into a large buffer without flushing per record.
+
+    The stock handler formats a record in shouldRollover and again in emit,
+    stats the log path and flushes the stream on every record. Flushing is
+    left to _FlushingQueueListener, which flushes whenever its queue drains.
+    """
+
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=_LOG_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors
         )
+        self._stream_size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0:
+            return False
+
+        record.etl_formatted = super().format(record)
+        return self._stream_size + self._encoded_length(record.etl_formatted) + 1 >= self.maxBytes
+
+    def format(self, record: logging.LogRecord) -> str:
+        formatted = record.__dict__.pop("etl_formatted", None)
+        return formatted if formatted is not None else super().format(record)
+
+    def _encoded_length(self, text: str) -> int:
+        """Bytes text takes in the file (ASCII text is one byte per character)."""
+        if text.isascii():
+            return len(text)
+        return len(text.encode(self.encoding or "utf-8", self.errors or "strict"))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            self._stream_size += self._encoded_length(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers each time the queue runs dry."""
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if self.queue.empty():
+            self._flush_handlers()
+
+        record = self.queue.get(block)
+        if record is self._sentinel:
+            self._flush_handlers()
+        return record
+
+    def _flush_handlers(self) -> None:
+        for handler in self.handlers:
+            handler.flush()
+
+
+class _RingHandler(logging.Handler):
+    """
+    Keep the most recent records in memory; append them to a file on close().
+    """
+
+    def __init__(self, filename: Path, capacity: int) -> None:
+        super().__init__()
+        self.filename = filename
+        self.records = collections.deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+    def close(self) -> None:
+        try:
+            if self.records:
+                with open(self.filename, "a", encoding="utf-8", errors="replace") as log_file:
+                    log_file.writelines(
+                        self.format(record) + "\n" for record in self.records
+                    )
+                self.records.clear()
+        finally:
+            super().close()
+
+
+class _EtlFormatter(logging.Formatter):
+    """
+    Formatter with the ETL line layout compiled into an f-string.
+
+    Only _LOG_FORMAT is accepted, since formatMessage renders that layout
+    directly; exception and stack text are still appended by format().
+    The date/time part of asctime is rendered once per second and reused.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        if self._fmt != _LOG_FORMAT:
+            raise ValueError(
+                f"_EtlFormatter renders {_LOG_FORMAT!r} only, got {self._fmt!r}"
+            )
+        self._cached_second = None
+        self._cached_time = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(self.default_time_format, self.converter(second))
+            self._cached_second = second
+        return self.default_msec_format % (self._cached_time, record.msecs)
 
-        # -----------------------------------------------------------------------------
-        # Configure format for handler
-        # -----------------------------------------------------------------------------
-        formatter = logging.Formatter(
-            "%(asctime)s | %(levelname)s | %(module)s | %(pipeline_name)s | %(run_id)s | %(message)s"
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        return (
+            f"{record.asctime} | {record.levelname} | {record.module} | "
+            f"{record.pipeline_name} | {record.run_id} | {record.message}"
         )
-        handler.setFormatter(formatter)
 
-        # -----------------------------------------------------------------------------
-        # Add handler to logger
-        # -----------------------------------------------------------------------------
-        logger.addHandler(handler)
+
+class _ContextFilter(logging.Filter):
+    """Stamp run_id / pipeline_name from the current context onto each record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.run_id = _RUN_ID.get()
+        record.pipeline_name = _PIPELINE_NAME.get()
+        return True
+
+
+@contextmanager
+def worker_log_queue() -> Iterator[multiprocessing.Queue]:
+    """
+    Yield a queue for worker processes to log into.
+
+    Pass it to a process pool with initializer=init_worker. A listener in
+    this process writes the queued records to this process's handler, so
+    the log file has one writer. Exit the pool before this context so its
+    records are written before the listener stops.
+
+    :return: Queue to hand to init_worker
+    """
+    _ensure_handlers(logging.getLogger(LOGGER_NAME))
+
+    log_queue = multiprocessing.Queue()
+    listener = _FlushingQueueListener(log_queue, *_LISTENER.handlers)
+    listener.start()
+    try:
+        yield log_queue
+    finally:
+        listener.stop()
+        log_queue.close()
+        log_queue.join_thread()
+
+
+def init_worker(log_queue: multiprocessing.Queue) -> None:
+    """
+    Process pool initializer: send this worker's records to log_queue.
+
+    The worker gets no file handler of its own, so workers never rotate or
+    buffer the shared log file.
+
+    :param log_queue: Queue yielded by worker_log_queue in the parent
+    :return: None
+    """
+    global _LISTENER, _LISTENER_PID
+
+    logger = logging.getLogger(LOGGER_NAME)
+    with _INIT_LOCK:
+        logger.handlers.clear()
+        logger.addHandler(QueueHandler(log_queue))
         logger.propagate = False
+        _LISTENER = None
+        _LISTENER_PID = os.getpid()
+
+
+def _ensure_handlers(logger: logging.Logger) -> None:
+    """
+    Attach this process's handlers unless already done.
+
+    Checked again under the lock so concurrent callers attach one handler.
+    """
+    if not logger.handlers or _LISTENER_PID != os.getpid():
+        with _INIT_LOCK:
+            if not logger.handlers or _LISTENER_PID != os.getpid():
+                _attach_handlers(logger)
+
+
+def _attach_handlers(logger: logging.Logger) -> None:
+    """
+    Replace the logger's handlers with a QueueHandler fed to a file listener.
+    """
+    logger.handlers.clear()
+
+    # -----------------------------------------------------------------------------
+    # Create handler
+    # -----------------------------------------------------------------------------
+    if LOG_MODE == "memory":
+        handler = _RingHandler(LOG_FILE, _RING_BUFFER_RECORDS)
+    else:
+        handler = _FastRotatingFileHandler(
+            filename = LOG_FILE,
+            maxBytes = 5 * 1024 * 1024, # 5MB log
+            backupCount = 3, # 3 backups to be kept before rotating logs
+            encoding = "utf-8",
+            errors = "replace" # never fail a write on an unencodable character
+        )
+
+    # -----------------------------------------------------------------------------
+    # Configure format for handler
+    # -----------------------------------------------------------------------------
+    formatter = _EtlFormatter(_LOG_FORMAT)
+    handler.setFormatter(formatter)
+
+    # -----------------------------------------------------------------------------
+    # Add handler to logger
+    # ETL code only enqueues records; a listener thread does the file I/O
+    # -----------------------------------------------------------------------------
+    _start_listener(handler)
+    logger.addHandler(QueueHandler(_LISTENER.queue))
+    logger.propagate = False
+
+
+def _start_listener(handler: logging.Handler) -> None:
+    """
+    Start the background thread that writes queued records to handler.
+
+    Registered with multiprocessing's finalizers (run at interpreter exit in
+    the main process and when a worker process exits) so queued records are
+    written and the handler closed before the process ends.
+    """
+    global _LISTENER, _LISTENER_PID
+
+    _LISTENER = _FlushingQueueListener(queue.SimpleQueue(), handler)
+    _LISTENER.start()
+    _LISTENER_PID = os.getpid()
+    mp_util.Finalize(_LISTENER, _stop_listener, args=(_LISTENER,), exitpriority=10)
+
+
+def _stop_listener(listener: QueueListener) -> None:
+    """Drain the listener's queue, then close its handlers."""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def _reset_init_lock() -> None:
+    """Give a forked child a fresh lock (the parent's may be held mid-setup)."""
+    global _INIT_LOCK
+
+    _INIT_LOCK = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_init_lock)
+
 
-    return logging.LoggerAdapter(
-        logger, extra={
-            "run_id": run_id,
-            "pipeline_name": pipeline_name
-        }
-    )
+logging.getLogger(LOGGER_NAME).addFilter(_ContextFilter())